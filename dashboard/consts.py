@@ -68,6 +68,8 @@ CANDIDATE_AGENT_NUMBER = max(env_integer("CANDIDATE_AGENT_NUMBER", 1), 1)
 WAIT_AVAILABLE_AGENT_TIMEOUT = 10
 TRY_TO_GET_AGENT_INFO_INTERVAL_SECONDS = 0.1
 RAY_JOB_ALLOW_DRIVER_ON_WORKER_NODES_ENV_VAR = "RAY_JOB_ALLOW_DRIVER_ON_WORKER_NODES"
+# Opt-in: exec job entrypoints that are plain commands directly, without /bin/sh.
+RAY_JOB_EXEC_ENTRYPOINT_WITHOUT_SHELL_ENV_VAR = "RAY_JOB_EXEC_ENTRYPOINT_WITHOUT_SHELL"
 # Port that dashboard prometheus metrics will be exported to
 DASHBOARD_METRIC_PORT = env_integer("DASHBOARD_METRIC_PORT", 44227)
 COMPONENT_METRICS_TAG_KEYS = ["ip", "pid", "Component", "SessionName"]
@@ -4,7 +4,7 @@ import time
 from dataclasses import dataclass, replace, asdict
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ray._private import ray_constants
 from ray._private.gcs_utils import GcsAioClient
@@ -93,7 +93,8 @@ class JobInfo:
     driver_node_id: Optional[str] = None
 
     def __post_init__(self):
-        if isinstance(self.status, str):
+        # JobStatus is itself a str, so only convert plain strings.
+        if isinstance(self.status, str) and not isinstance(self.status, JobStatus):
             self.status = JobStatus(self.status)
         if self.message is None:
             if self.status == JobStatus.PENDING:
@@ -131,14 +132,23 @@ class JobInfo:
             A JSON-serializable dictionary representing the JobInfo object.
         """
 
+        json_dict = self._to_json_dict()
+
+        # Assert that the dictionary is JSON-serializable.
+        json.dumps(json_dict)
+
+        return json_dict
+
+    def _to_json_dict(self) -> Dict[str, Any]:
+        """Like to_json(), but without checking that the result is serializable.
+
+        Used by callers that serialize the dictionary right away anyway.
+        """
         json_dict = asdict(self)
 
         # Convert enum values to strings.
         json_dict["status"] = str(json_dict["status"])
 
-        # Assert that the dictionary is JSON-serializable.
-        json.dumps(json_dict)
-
         return json_dict
 
     @classmethod
@@ -160,7 +170,8 @@ class JobInfoStorageClient:
     """
 
     JOB_DATA_KEY_PREFIX = f"{ray_constants.RAY_INTERNAL_NAMESPACE_PREFIX}job_info_"
-    JOB_DATA_KEY = f"{JOB_DATA_KEY_PREFIX}{{job_id}}"
+    # Filled in with %-formatting, which is cheaper than str.format().
+    JOB_DATA_KEY = f"{JOB_DATA_KEY_PREFIX}%s"
 
     def __init__(self, gcs_aio_client: GcsAioClient):
         self._gcs_aio_client = gcs_aio_client
@@ -168,15 +179,17 @@ class JobInfoStorageClient:
 
     async def put_info(self, job_id: str, job_info: JobInfo):
         await self._gcs_aio_client.internal_kv_put(
-            self.JOB_DATA_KEY.format(job_id=job_id).encode(),
-            json.dumps(job_info.to_json()).encode(),
+            (self.JOB_DATA_KEY % job_id).encode(),
+            # Serializing here already validates the dictionary, so skip the
+            # duplicate json.dumps() done by to_json().
+            json.dumps(job_info._to_json_dict()).encode(),
             True,
             namespace=ray_constants.KV_NAMESPACE_JOB,
         )
 
     async def get_info(self, job_id: str, timeout: int = 30) -> Optional[JobInfo]:
         serialized_info = await self._gcs_aio_client.internal_kv_get(
-            self.JOB_DATA_KEY.format(job_id=job_id).encode(),
+            (self.JOB_DATA_KEY % job_id).encode(),
             namespace=ray_constants.KV_NAMESPACE_JOB,
             timeout=timeout,
         )
@@ -187,7 +200,7 @@ class JobInfoStorageClient:
 
     async def delete_info(self, job_id: str, timeout: int = 30):
         await self._gcs_aio_client.internal_kv_del(
-            self.JOB_DATA_KEY.format(job_id=job_id).encode(),
+            (self.JOB_DATA_KEY % job_id).encode(),
             False,
             namespace=ray_constants.KV_NAMESPACE_JOB,
             timeout=timeout,
@@ -199,10 +212,25 @@ class JobInfoStorageClient:
         status: JobStatus,
         message: Optional[str] = None,
         jobinfo_replace_kwargs: Optional[Dict[str, Any]] = None,
-    ):
-        """Puts or updates job status.  Sets end_time if status is terminal."""
+        old_info: Optional[JobInfo] = None,
+    ) -> JobInfo:
+        """Puts or updates job status.  Sets end_time if status is terminal.
 
-        old_info = await self.get_info(job_id)
+        Args:
+            job_id: The id of the job whose status is updated.
+            status: The new status of the job.
+            message: Optional message describing the new status.
+            jobinfo_replace_kwargs: Additional JobInfo fields to update.
+            old_info: The current JobInfo of the job, if already known by the
+                caller (e.g. because the caller is the only writer). If
+                provided, the read from the KV store is skipped.
+
+        Returns:
+            The JobInfo that was written.
+        """
+
+        if old_info is None:
+            old_info = await self.get_info(job_id)
 
         if jobinfo_replace_kwargs is None:
             jobinfo_replace_kwargs = dict()
@@ -220,6 +248,7 @@ class JobInfoStorageClient:
             new_info.end_time = int(time.time() * 1000)
 
         await self.put_info(job_id, new_info)
+        return new_info
 
     async def get_status(self, job_id: str) -> Optional[JobStatus]:
         job_info = await self.get_info(job_id)
@@ -244,15 +273,34 @@ class JobInfoStorageClient:
             ), "Unexpected format for internal_kv key for Job submission"
             job_ids.append(job_id_with_prefix[len(self.JOB_DATA_KEY_PREFIX) :])
 
-        async def get_job_info(job_id: str):
-            job_info = await self.get_info(job_id, timeout)
-            return job_id, job_info
+        return await self.get_infos(job_ids, timeout)
+
+    async def get_infos(
+        self, job_ids: List[str], timeout: int = 30
+    ) -> Dict[str, Optional[JobInfo]]:
+        """Gets the info of multiple jobs at once.
+
+        The internal KV store has no multi-get, so the reads are issued
+        concurrently over the same GCS channel. This costs about one round trip
+        of latency in total rather than one per job.
 
+        Returns:
+            A dictionary from job_id to its JobInfo, or to None if the job
+            doesn't exist.
+        """
+        job_infos = await asyncio.gather(
+            *[self.get_info(job_id, timeout) for job_id in job_ids]
+        )
+        return dict(zip(job_ids, job_infos))
+
+    async def get_statuses(
+        self, job_ids: List[str], timeout: int = 30
+    ) -> Dict[str, Optional[JobStatus]]:
+        """Gets the status of multiple jobs at once, see get_infos()."""
+        job_infos = await self.get_infos(job_ids, timeout)
         return {
-            job_id: job_info
-            for job_id, job_info in await asyncio.gather(
-                *[get_job_info(job_id) for job_id in job_ids]
-            )
+            job_id: job_info.status if job_info is not None else None
+            for job_id, job_info in job_infos.items()
         }
 
 
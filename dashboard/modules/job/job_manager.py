@@ -1,9 +1,13 @@
 import asyncio
 import copy
+import errno
+import io
 import json
 import logging
 import os
 import random
+import shlex
+import shutil
 import signal
 import string
 import subprocess
@@ -12,7 +16,7 @@ import time
 import traceback
 from asyncio.tasks import FIRST_COMPLETED
 from collections import deque
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 from ray.util.scheduling_strategies import (
     NodeAffinitySchedulingStrategy,
     SchedulingStrategyT,
@@ -23,7 +27,10 @@ from ray._private.utils import run_background_task
 import ray._private.ray_constants as ray_constants
 from ray._private.runtime_env.constants import RAY_JOB_CONFIG_JSON_ENV_VAR
 from ray.actor import ActorHandle
-from ray.dashboard.consts import RAY_JOB_ALLOW_DRIVER_ON_WORKER_NODES_ENV_VAR
+from ray.dashboard.consts import (
+    RAY_JOB_ALLOW_DRIVER_ON_WORKER_NODES_ENV_VAR,
+    RAY_JOB_EXEC_ENTRYPOINT_WITHOUT_SHELL_ENV_VAR,
+)
 from ray.dashboard.modules.job.common import (
     JOB_ID_METADATA_KEY,
     JOB_NAME_METADATA_KEY,
@@ -76,17 +83,54 @@ def generate_job_id() -> str:
     return f"raysubmit_{id_part}"
 
 
+# Characters that only a shell can interpret. Entrypoints that contain any of
+# them (pipes, redirections, variables, globs, env var assignments, ...) are
+# run through a shell.
+_SHELL_SPECIAL_CHARS = frozenset("|&;<>()$`\\*?[]{}#~=!\n")
+
+
+def _get_entrypoint_argv(entrypoint: str) -> Optional[List[str]]:
+    """Returns the argv to execute the entrypoint without a shell.
+
+    Only used if RAY_JOB_EXEC_ENTRYPOINT_WITHOUT_SHELL is set to 1.
+
+    Returns None if the entrypoint needs to be run through a shell, either
+    because it uses shell syntax or because its executable can't be found
+    (e.g. it's a shell builtin), or because we're on Windows.
+    """
+    if sys.platform == "win32" or not _SHELL_SPECIAL_CHARS.isdisjoint(entrypoint):
+        return None
+    try:
+        argv = shlex.split(entrypoint)
+    except ValueError:
+        # E.g. unbalanced quotes, let the shell report the error.
+        return None
+    if not argv or shutil.which(argv[0]) is None:
+        return None
+    return argv
+
+
 class JobLogStorageClient:
     """
     Disk storage for stdout / stderr of driver script logs.
     """
 
-    JOB_LOGS_PATH = "job-driver-{job_id}.log"
+    # Filled in with %-formatting, which is cheaper than str.format().
+    JOB_LOGS_PATH = "job-driver-%s.log"
     # Number of last N lines to put in job message upon failure.
     NUM_LOG_LINES_ON_ERROR = 10
     # Maximum number of characters to print out of the logs to avoid
     # HUGE log outputs that bring down the api server
     MAX_LOG_SIZE = 20000
+    # Number of bytes read from the end of the log file when looking for the
+    # last lines, so that we never read the whole log of a long-running job.
+    # A character is at most 4 bytes in UTF-8, so this always covers at least
+    # MAX_LOG_SIZE characters.
+    LOG_TAIL_READ_BYTES = 4 * MAX_LOG_SIZE
+
+    def __init__(self):
+        # Resolved lazily, the logs dir is fixed for the lifetime of the node.
+        self._logs_dir: Optional[str] = None
 
     def get_logs(self, job_id: str) -> str:
         try:
@@ -109,27 +153,30 @@ class JobLogStorageClient:
             job_id: The id of the job whose logs we want to return
             num_log_lines: The number of lines to return.
         """
-        log_tail_iter = self.tail_logs(job_id)
-        log_tail_deque = deque(maxlen=num_log_lines)
-        for lines in log_tail_iter:
-            if lines is None:
-                break
-            else:
-                # log_tail_iter can return batches of lines at a time.
-                for line in lines:
-                    log_tail_deque.append(line)
+        try:
+            with open(self.get_log_file_path(job_id), "rb") as f:
+                # Only read the end of the file instead of the whole log.
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(0, size - self.LOG_TAIL_READ_BYTES))
+                log_tail = f.read()
+        except FileNotFoundError:
+            return ""
 
+        # Split lines the same way as reading the file in text mode would.
+        log_tail_lines = io.StringIO(
+            log_tail.decode("utf-8", errors="replace"), newline=None
+        )
+        log_tail_deque = deque(log_tail_lines, maxlen=num_log_lines)
         return "".join(log_tail_deque)[-self.MAX_LOG_SIZE :]
 
-    def get_log_file_path(self, job_id: str) -> Tuple[str, str]:
+    def get_log_file_path(self, job_id: str) -> str:
         """
         Get the file path to the logs of a given job. Example:
             /tmp/ray/session_date/logs/job-driver-{job_id}.log
         """
-        return os.path.join(
-            ray._private.worker._global_node.get_logs_dir_path(),
-            self.JOB_LOGS_PATH.format(job_id=job_id),
-        )
+        if self._logs_dir is None:
+            self._logs_dir = ray._private.worker._global_node.get_logs_dir_path()
+        return os.path.join(self._logs_dir, self.JOB_LOGS_PATH % job_id)
 
 
 class JobSupervisor:
@@ -153,6 +200,7 @@ class JobSupervisor:
         gcs_address: str,
     ):
         self._job_id = job_id
+        self._gcs_address = gcs_address
         gcs_aio_client = GcsAioClient(address=gcs_address)
         self._job_info_client = JobInfoStorageClient(gcs_aio_client)
         self._log_client = JobLogStorageClient()
@@ -168,6 +216,15 @@ class JobSupervisor:
         # Windows Job Object used to handle stopping the child processes.
         self._win32_job_object = None
 
+        # Write end of the pipe watched by the process that kills the driver's
+        # process group when this actor dies. Must stay open until then.
+        self._watchdog_pipe_fd: Optional[int] = None
+
+        # The JobInfo last written by this supervisor. While the job is
+        # running the supervisor is the only writer of its JobInfo, so this
+        # lets status transitions skip the read in put_status().
+        self._job_info: Optional[JobInfo] = None
+
     def _get_driver_runtime_env(
         self, resources_specified: bool = False
     ) -> Dict[str, Any]:
@@ -198,6 +255,11 @@ class JobSupervisor:
         """Used to check the health of the actor."""
         pass
 
+    async def _put_status(self, status: JobStatus, **kwargs):
+        self._job_info = await self._job_info_client.put_status(
+            self._job_id, status, old_info=self._job_info, **kwargs
+        )
+
     def _exec_entrypoint(self, logs_path: str) -> subprocess.Popen:
         """
         Runs the entrypoint command as a child process, streaming stderr &
@@ -218,15 +280,40 @@ class JobSupervisor:
             child_process: Child process that runs the driver command. Can be
                 terminated or killed upon user calling stop().
         """
-        with open(logs_path, "w") as logs_file:
-            child_process = subprocess.Popen(
-                self._entrypoint,
-                shell=True,
+        # Only the child process writes to the log file, so hand it a raw
+        # write-only fd instead of a buffered text file object.
+        logs_fd = os.open(logs_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            popen_kwargs = dict(
                 start_new_session=True,
-                stdout=logs_file,
+                stdout=logs_fd,
                 stderr=subprocess.STDOUT,
             )
-            parent_pid = os.getpid()
+            child_process = None
+            # If opted in, execute simple commands directly rather than through
+            # /bin/sh, so that we don't fork an extra process per job and the
+            # child is the driver itself. This is opt-in since it changes which
+            # process receives stop signals, and shell aliases and functions
+            # don't apply.
+            if (
+                os.environ.get(RAY_JOB_EXEC_ENTRYPOINT_WITHOUT_SHELL_ENV_VAR, "0")
+                == "1"
+            ):
+                entrypoint_argv = _get_entrypoint_argv(self._entrypoint)
+                if entrypoint_argv is not None:
+                    try:
+                        child_process = subprocess.Popen(
+                            entrypoint_argv, **popen_kwargs
+                        )
+                    except OSError as e:
+                        # E.g. a script without a shebang line, which only a shell
+                        # can run.
+                        if e.errno != errno.ENOEXEC:
+                            raise
+            if child_process is None:
+                child_process = subprocess.Popen(
+                    self._entrypoint, shell=True, **popen_kwargs
+                )
             child_pid = child_process.pid
             # Create new pgid with new subprocess to execute driver command
 
@@ -237,16 +324,24 @@ class JobSupervisor:
                     # Process died before we could get its pgid.
                     return child_process
 
-                # Open a new subprocess to kill the child process when the parent
-                # process dies kill -s 0 parent_pid will succeed if the parent is
-                # alive. If it fails, SIGKILL the child process group and exit
-                subprocess.Popen(
-                    f"while kill -s 0 {parent_pid}; do sleep 1; done; kill -9 -{child_pgid}",  # noqa: E501
-                    shell=True,
-                    # Suppress output
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
+                # Open a new subprocess to kill the child process group when the
+                # parent process dies. It blocks reading from a pipe whose write
+                # end is only held by this process, so the read returns EOF as
+                # soon as the parent exits, however it dies. Then SIGKILL the
+                # child process group and exit. Unlike polling the parent pid,
+                # this doesn't wake up until the parent is gone.
+                read_fd, self._watchdog_pipe_fd = os.pipe()
+                try:
+                    subprocess.Popen(
+                        f"read _; kill -9 -{child_pgid}",
+                        shell=True,
+                        stdin=read_fd,
+                        # Suppress output
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                    )
+                finally:
+                    os.close(read_fd)
 
             elif sys.platform == "win32" and win32api:
                 # Create a JobObject to which the child process (and its children)
@@ -273,29 +368,33 @@ class JobSupervisor:
                 win32job.AssignProcessToJobObject(self._win32_job_object, child_handle)
 
             return child_process
+        finally:
+            # The child process has its own copy of the fd.
+            os.close(logs_fd)
 
     def _get_driver_env_vars(self, resources_specified: bool) -> Dict[str, str]:
         """Returns environment variables that should be set in the driver."""
-        # RAY_ADDRESS may be the dashboard URL but not the gcs address,
-        # so when the environment variable is not empty, we force set RAY_ADDRESS
-        # to "auto" to avoid function `canonicalize_bootstrap_address_or_die` returning
-        # the wrong GCS address.
+        # RAY_ADDRESS may be the dashboard URL but not the gcs address, so it
+        # is always overridden below. Use the GCS address this supervisor was
+        # created with (and is connected to) rather than autodetecting the
+        # bootstrap address again, which reads the cluster address file and
+        # may fall back to scanning for GCS processes.
         # TODO(Jialing He, Archit Kulkarni): Definition of Specification RAY_ADDRESS
-        if ray_constants.RAY_ADDRESS_ENVIRONMENT_VARIABLE in os.environ:
-            os.environ[ray_constants.RAY_ADDRESS_ENVIRONMENT_VARIABLE] = "auto"
-        ray_addr = ray._private.services.canonicalize_bootstrap_address_or_die(
-            "auto", ray.worker._global_node._ray_params.temp_dir
-        )
+        ray_addr = self._gcs_address
         assert ray_addr is not None
         return {
             # Set JobConfig for the child process (runtime_env, metadata).
+            # Use the compact JSON form, the runtime_env can be large (e.g. long
+            # pip lists) and the environment is copied into every process the
+            # driver forks.
             RAY_JOB_CONFIG_JSON_ENV_VAR: json.dumps(
                 {
                     "runtime_env": self._get_driver_runtime_env(resources_specified),
                     "metadata": self._metadata,
-                }
+                },
+                separators=(",", ":"),
             ),
-            # Always set RAY_ADDRESS as find_bootstrap_address address for
+            # Always set RAY_ADDRESS to the GCS address for
             # job submission. In case of local development, prevent user from
             # re-using http://{address}:{dashboard_port} to interact with
             # jobs SDK.
@@ -331,7 +430,10 @@ class JobSupervisor:
             variables.
         3) Handle concurrent events of driver execution and
         """
-        curr_status = await self._job_info_client.get_status(self._job_id)
+        # Keep the info read here, so that the RUNNING status update below
+        # doesn't have to read it from the KV store again.
+        self._job_info = await self._job_info_client.get_info(self._job_id)
+        curr_status = self._job_info.status if self._job_info is not None else None
         assert curr_status == JobStatus.PENDING, "Run should only be called once."
 
         if _start_signal_actor:
@@ -345,8 +447,7 @@ class JobSupervisor:
         )
         driver_node_id = ray.worker.global_worker.current_node_id.hex()
 
-        await self._job_info_client.put_status(
-            self._job_id,
+        await self._put_status(
             JobStatus.RUNNING,
             jobinfo_replace_kwargs={
                 "driver_agent_http_address": driver_agent_http_address,
@@ -367,8 +468,11 @@ class JobSupervisor:
             child_process = self._exec_entrypoint(log_path)
 
             polling_task = create_task(self._polling(child_process))
+            # asyncio.wait() only takes tasks, wrap the stop event explicitly so
+            # that whichever one loses the race can be cancelled below.
+            stop_event_task = create_task(self._stop_event.wait())
             finished, _ = await asyncio.wait(
-                [polling_task, self._stop_event.wait()], return_when=FIRST_COMPLETED
+                [polling_task, stop_event_task], return_when=FIRST_COMPLETED
             )
 
             if self._stop_event.is_set():
@@ -404,17 +508,16 @@ class JobSupervisor:
                             )
                             polling_task.cancel()
                             child_process.kill()
-                await self._job_info_client.put_status(self._job_id, JobStatus.STOPPED)
+                await self._put_status(JobStatus.STOPPED)
             else:
                 # Child process finished execution and no stop event is set
                 # at the same time
+                stop_event_task.cancel()
                 assert len(finished) == 1, "Should have only one coroutine done"
                 [child_process_task] = finished
                 return_code = child_process_task.result()
                 if return_code == 0:
-                    await self._job_info_client.put_status(
-                        self._job_id, JobStatus.SUCCEEDED
-                    )
+                    await self._put_status(JobStatus.SUCCEEDED)
                 else:
                     log_tail = self._log_client.get_last_n_log_lines(self._job_id)
                     if log_tail is not None and log_tail != "":
@@ -425,18 +528,14 @@ class JobSupervisor:
                         )
                     else:
                         message = None
-                    await self._job_info_client.put_status(
-                        self._job_id, JobStatus.FAILED, message=message
-                    )
+                    await self._put_status(JobStatus.FAILED, message=message)
         except Exception:
             logger.error(
                 "Got unexpected exception while trying to execute driver "
                 f"command. {traceback.format_exc()}"
             )
             try:
-                await self._job_info_client.put_status(
-                    self._job_id, JobStatus.FAILED, message=traceback.format_exc()
-                )
+                await self._put_status(JobStatus.FAILED, message=traceback.format_exc())
             except Exception:
                 logger.error(
                     "Failed to update job status to FAILED. "
@@ -470,7 +569,11 @@ class JobManager:
         self._gcs_address = gcs_aio_client._channel._gcs_address
         self._log_client = JobLogStorageClient()
         self._supervisor_actor_cls = ray.remote(JobSupervisor)
+        self._node_resource_key: Optional[str] = None
         self.monitored_jobs = set()
+        # Supervisor actor handles of the monitored jobs, so that looking them
+        # up doesn't need a GCS round trip.
+        self._monitored_job_supervisors: Dict[str, ActorHandle] = {}
         try:
             self.event_logger = get_event_logger(Event.SourceType.JOBS, logs_dir)
         except Exception:
@@ -490,6 +593,9 @@ class JobManager:
                 run_background_task(self._monitor_job(job_id))
 
     def _get_actor_for_job(self, job_id: str) -> Optional[ActorHandle]:
+        job_supervisor = self._monitored_job_supervisors.get(job_id)
+        if job_supervisor is not None:
+            return job_supervisor
         try:
             return ray.get_actor(
                 JOB_ACTOR_NAME_TEMPLATE.format(job_id=job_id),
@@ -515,6 +621,7 @@ class JobManager:
             await self._monitor_job_internal(job_id, job_supervisor)
         finally:
             self.monitored_jobs.remove(job_id)
+            self._monitored_job_supervisors.pop(job_id, None)
 
     async def _monitor_job_internal(
         self, job_id: str, job_supervisor: Optional[ActorHandle] = None
@@ -532,13 +639,24 @@ class JobManager:
                 )
                 is_alive = False
 
+        if job_supervisor is not None:
+            # Stored for as long as the supervisor answers pings, see below.
+            self._monitored_job_supervisors[job_id] = job_supervisor
+
         while is_alive:
             try:
                 await job_supervisor.ping.remote()
                 await asyncio.sleep(self.JOB_MONITOR_LOOP_PERIOD_S)
             except Exception as e:
                 is_alive = False
-                job_status = await self._job_info_client.get_status(job_id)
+                # The supervisor is dead or exiting, so stop handing out its handle
+                # before anything else is awaited. Lookups fall back to
+                # ray.get_actor(), which doesn't find dead actors.
+                self._monitored_job_supervisors.pop(job_id, None)
+                # Read the info once and pass it along to any status update
+                # below, instead of having put_status() read it again.
+                job_info = await self._job_info_client.get_info(job_id)
+                job_status = job_info.status
                 job_error_message = None
                 if job_status == JobStatus.FAILED:
                     job_error_message = (
@@ -558,6 +676,7 @@ class JobManager:
                         job_id,
                         job_status,
                         message=job_error_message,
+                        old_info=job_info,
                     )
                 elif isinstance(e, ActorUnschedulableError):
                     logger.info(
@@ -568,6 +687,7 @@ class JobManager:
                         job_id,
                         JobStatus.FAILED,
                         message=(f"Job supervisor actor could not be scheduled: {e}"),
+                        old_info=job_info,
                     )
                 else:
                     logger.warning(
@@ -579,6 +699,7 @@ class JobManager:
                         job_id,
                         job_status,
                         message=job_error_message,
+                        old_info=job_info,
                     )
 
                 # Log events
@@ -601,15 +722,22 @@ class JobManager:
 
         It can be used for actor placement.
         """
+        # The current node doesn't change during the lifetime of the
+        # JobManager, so only look it up in the (potentially large) node
+        # table once.
+        if self._node_resource_key is not None:
+            return self._node_resource_key
+
         current_node_id = ray.get_runtime_context().node_id.hex()
         for node in ray.nodes():
             if node["NodeID"] == current_node_id:
                 # Found the node.
-                for key in node["Resources"].keys():
+                for key in node["Resources"]:
                     if key.startswith("node:"):
+                        self._node_resource_key = key
                         return key
-        else:
-            raise ValueError("Cannot find the node dictionary for current node.")
+                break
+        raise ValueError("Cannot find the node dictionary for current node.")
 
     def _handle_supervisor_startup(self, job_id: str, result: Optional[Exception]):
         """Handle the result of starting a job supervisor actor.
@@ -20,22 +20,41 @@ RAY_VERSIONS=("2.0.1")
 
 for RAY_VERSION in "${RAY_VERSIONS[@]}"
 do
-    env_name=${JOB_COMPATIBILITY_TEST_TEMP_ENV}
-
-    # Clean up if env name is already taken from previous leaking runs
-    conda env remove --name="${env_name}"
-
-    printf "\n\n\n"
-    echo "========================================================================================="
-    printf "Creating new conda environment with python %s for ray %s \n" "${PYTHON_VERSION}" "${RAY_VERSION}"
-    echo "========================================================================================="
-    printf "\n\n\n"
-
-    conda create -y -n "${env_name}" python="${PYTHON_VERSION}"
-    conda activate "${env_name}"
+    # Creating a new conda env takes minutes. Set JOB_COMPATIBILITY_TEST_REUSE_ENV=1
+    # (e.g. on a dev machine) to keep the env after the run and reuse it in later
+    # runs, keyed by the ray and python versions. By default it's removed.
+    if [ "${JOB_COMPATIBILITY_TEST_REUSE_ENV}" == "1" ]; then
+        env_name="${JOB_COMPATIBILITY_TEST_TEMP_ENV}-ray${RAY_VERSION}-py${PYTHON_VERSION}"
+    else
+        env_name=${JOB_COMPATIBILITY_TEST_TEMP_ENV}
+    fi
 
-    pip install -U ray=="${RAY_VERSION}"
-    pip install -U ray[default]=="${RAY_VERSION}"
+    if [ "${JOB_COMPATIBILITY_TEST_REUSE_ENV}" == "1" ] && \
+        conda env list | grep -q "^${env_name} " && \
+        conda run -n "${env_name}" python -c "import ray; assert ray.__version__ == '${RAY_VERSION}'"; then
+        printf "\n\n\n"
+        echo "========================================================================================="
+        printf "Reusing existing conda environment %s \n" "${env_name}"
+        echo "========================================================================================="
+        printf "\n\n\n"
+
+        conda activate "${env_name}"
+    else
+        # Clean up if env name is taken by an env from a previous broken run
+        conda env remove --name="${env_name}"
+
+        printf "\n\n\n"
+        echo "========================================================================================="
+        printf "Creating new conda environment with python %s for ray %s \n" "${PYTHON_VERSION}" "${RAY_VERSION}"
+        echo "========================================================================================="
+        printf "\n\n\n"
+
+        conda create -y -n "${env_name}" python="${PYTHON_VERSION}"
+        conda activate "${env_name}"
+
+        pip install -U ray=="${RAY_VERSION}"
+        pip install -U ray[default]=="${RAY_VERSION}"
+    fi
 
     printf "\n\n\n"
     echo "========================================================="
@@ -62,7 +81,10 @@ do
     cleanup () {
         unset RAY_ADDRESS
         ray stop --force
-        conda remove -y --name "${env_name}" --all
+        # Keep the conda env around for the next run only if asked to.
+        if [ "${JOB_COMPATIBILITY_TEST_REUSE_ENV}" != "1" ]; then
+            conda remove -y --name "${env_name}" --all
+        fi
     }
 
     JOB_ID=$(python -c "import uuid; print(uuid.uuid4().hex)")
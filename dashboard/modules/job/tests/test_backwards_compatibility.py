@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 import pytest
@@ -12,20 +13,26 @@ from ray._private.test_utils import wait_for_condition
 
 logger = logging.getLogger(__name__)
 
+# Set JOB_COMPATIBILITY_TEST_REUSE_ENV=1 to keep the old ray conda envs after the
+# test and reuse them in later runs, instead of creating and removing them each run.
+_REUSE_CONDA_ENV = os.environ.get("JOB_COMPATIBILITY_TEST_REUSE_ENV") == "1"
+
 
 @contextmanager
 def conda_env(env_name):
     # Set env name for shell script
     os.environ["JOB_COMPATIBILITY_TEST_TEMP_ENV"] = env_name
-    # Delete conda env if it already exists
     try:
         yield
     finally:
-        # Clean up created conda env upon test exit to prevent leaking
         del os.environ["JOB_COMPATIBILITY_TEST_TEMP_ENV"]
-        subprocess.run(
-            f"conda env remove -y --name {env_name}", shell=True, stdout=subprocess.PIPE
-        )
+        if not _REUSE_CONDA_ENV:
+            # Clean up created conda env upon test exit to prevent leaking
+            subprocess.run(
+                f"conda env remove -y --name {env_name}",
+                shell=True,
+                stdout=subprocess.PIPE,
+            )
 
 
 def _compatibility_script_path(file_name: str) -> str:
@@ -34,29 +41,42 @@ def _compatibility_script_path(file_name: str) -> str:
     )
 
 
+async def _run_and_stream_output(cmd: str) -> int:
+    """Run cmd, streaming its stdout & stderr as it runs. Returns the exit code."""
+    process = await asyncio.create_subprocess_exec(
+        cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+    )
+    while True:
+        line = await process.stdout.readline()
+        if not line:
+            break
+        sys.stdout.write(line.decode(errors="replace"))
+        sys.stdout.flush()
+    return await process.wait()
+
+
 class TestBackwardsCompatibility:
     def test_cli(self):
         """
         Test that the current commit's CLI works with old server-side Ray versions.
 
-        1) Create a new conda environment with old ray version X installed;
+        1) Create (or reuse) a conda environment with old ray version X installed;
             inherits same env as current conda envionment except ray version
         2) (Server) Start head node and dashboard with old ray version X
         3) (Client) Use current commit's CLI code to do sample job submission flow
         4) Deactivate the new conda environment and back to original place
         """
-        # Shell script creates and cleans up tmp conda environment regardless
-        # of the outcome
-        env_name = f"jobs-backwards-compatibility-{uuid.uuid4().hex}"
+        # Shell script creates tmp conda environment, and cleans it up regardless
+        # of the outcome unless it's reused.
+        if _REUSE_CONDA_ENV:
+            env_name = "jobs-backwards-compatibility"
+        else:
+            env_name = f"jobs-backwards-compatibility-{uuid.uuid4().hex}"
         with conda_env(env_name):
             shell_cmd = f"{_compatibility_script_path('test_backwards_compatibility.sh')}"  # noqa: E501
 
-            try:
-                subprocess.check_output(shell_cmd, shell=True, stderr=subprocess.STDOUT)
-            except subprocess.CalledProcessError as e:
-                logger.error(str(e))
-                logger.error(e.stdout.decode())
-                raise e
+            return_code = asyncio.run(_run_and_stream_output(shell_cmd))
+            assert return_code == 0, f"{shell_cmd} exited with code {return_code}"
 
 
 @pytest.mark.skipif(
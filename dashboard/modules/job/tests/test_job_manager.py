@@ -22,11 +22,16 @@ from ray._private.test_utils import (
 )
 from ray.dashboard.modules.job.common import JOB_ID_METADATA_KEY, JOB_NAME_METADATA_KEY
 from ray.dashboard.modules.job.job_manager import (
+    JobLogStorageClient,
     JobManager,
     JobSupervisor,
+    _get_entrypoint_argv,
     generate_job_id,
 )
-from ray.dashboard.consts import RAY_JOB_ALLOW_DRIVER_ON_WORKER_NODES_ENV_VAR
+from ray.dashboard.consts import (
+    RAY_JOB_ALLOW_DRIVER_ON_WORKER_NODES_ENV_VAR,
+    RAY_JOB_EXEC_ENTRYPOINT_WITHOUT_SHELL_ENV_VAR,
+)
 from ray.job_submission import JobStatus
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy  # noqa: F401
 from ray.tests.conftest import call_ray_start  # noqa: F401
@@ -214,6 +219,35 @@ def check_subprocess_cleaned(pid):
     return psutil.pid_exists(pid) is False
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="Always uses a shell on Windows.")
+def test_get_entrypoint_argv():
+    # Simple commands are executed directly.
+    assert _get_entrypoint_argv("echo hello") == ["echo", "hello"]
+    assert _get_entrypoint_argv("python  script.py --name 'a b'") == [
+        "python",
+        "script.py",
+        "--name",
+        "a b",
+    ]
+
+    # Anything using shell syntax needs a shell.
+    for entrypoint in [
+        "echo hello | grep hello",
+        "echo $HOME",
+        "FOO=bar python script.py",
+        "python script.py > out.log",
+        "cd /tmp && python script.py",
+        "ls *.py",
+        "echo 'unbalanced",
+        "",
+    ]:
+        assert _get_entrypoint_argv(entrypoint) is None, entrypoint
+
+    # So do shell builtins and unknown executables.
+    assert _get_entrypoint_argv("source env.sh") is None
+    assert _get_entrypoint_argv("not_an_executable_abc123 arg") is None
+
+
 def test_generate_job_id():
     ids = set()
     for _ in range(10000):
@@ -264,6 +298,21 @@ async def test_list_jobs(job_manager: JobManager):
     assert jobs_info["2"].metadata == metadata
 
 
+@pytest.mark.asyncio
+async def test_get_statuses(job_manager: JobManager):
+    job_id = await job_manager.submit_job(entrypoint="echo hi")
+    await async_wait_for_condition_async_predicate(
+        check_job_succeeded, job_manager=job_manager, job_id=job_id
+    )
+
+    job_info_client = job_manager.job_info_client()
+    assert await job_info_client.get_statuses([]) == {}
+    assert await job_info_client.get_statuses([job_id, "nonexistent"]) == {
+        job_id: JobStatus.SUCCEEDED,
+        "nonexistent": None,
+    }
+
+
 @pytest.mark.asyncio
 async def test_pass_job_id(job_manager):
     submission_id = "my_custom_id"
@@ -311,6 +360,31 @@ class TestShellScriptExecution:
         )
         assert job_manager.get_job_logs(job_id) == "test_job_manager.py\n"
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="Needs a POSIX shell.")
+    @pytest.mark.parametrize("exec_without_shell", ["0", "1"])
+    async def test_submit_script_without_shebang(
+        self, job_manager, tmp_path, exec_without_shell
+    ):
+        """Scripts without a shebang line are run by the shell, also when
+        entrypoints are otherwise exec'd directly.
+        """
+        script_path = tmp_path / "script_without_shebang"
+        script_path.write_text("echo hello from script\n")
+        script_path.chmod(0o755)
+        job_id = await job_manager.submit_job(
+            entrypoint=str(script_path),
+            runtime_env={
+                "env_vars": {
+                    RAY_JOB_EXEC_ENTRYPOINT_WITHOUT_SHELL_ENV_VAR: exec_without_shell
+                }
+            },
+        )
+
+        await async_wait_for_condition_async_predicate(
+            check_job_succeeded, job_manager=job_manager, job_id=job_id
+        )
+        assert job_manager.get_job_logs(job_id) == "hello from script\n"
+
     async def test_subprocess_exception(self, job_manager):
         """
         Run a python script with exception, ensure:
@@ -613,6 +687,9 @@ class TestAsyncAPI:
             await async_wait_for_condition_async_predicate(
                 check_job_failed, job_manager=job_manager, job_id=job_id
             )
+            # The dead supervisor's handle isn't handed out anymore.
+            assert job_manager._get_actor_for_job(job_id) is None
+            assert job_manager.stop_job(job_id) is False
 
             # Ensure driver subprocess gets cleaned up after job reached
             # termination state
@@ -959,5 +1036,34 @@ async def test_failed_job_logs_max_char(job_manager):
     )
 
 
+def test_get_last_n_log_lines(tmp_path, monkeypatch):
+    """Test that only the tail of the log file is needed for the last lines."""
+    log_client = JobLogStorageClient()
+    log_path = str(tmp_path / "job-driver-test.log")
+    monkeypatch.setattr(log_client, "get_log_file_path", lambda job_id: log_path)
+
+    # No log file yet.
+    assert log_client.get_last_n_log_lines("test") == ""
+
+    # The file is much larger than the part that is read from the end.
+    num_lines = log_client.LOG_TAIL_READ_BYTES
+    with open(log_path, "w") as f:
+        for i in range(num_lines):
+            f.write(f"line {i}\n")
+    assert log_client.get_last_n_log_lines("test") == "".join(
+        f"line {i}\n" for i in range(num_lines - 10, num_lines)
+    )
+    assert log_client.get_last_n_log_lines("test", num_log_lines=2) == (
+        f"line {num_lines - 2}\nline {num_lines - 1}\n"
+    )
+
+    # Long lines are truncated to the last MAX_LOG_SIZE characters.
+    with open(log_path, "w") as f:
+        f.write("1234567890" * 2100 + "\nlast line\n")
+    log_tail = log_client.get_last_n_log_lines("test")
+    assert len(log_tail) == log_client.MAX_LOG_SIZE
+    assert log_tail.endswith("1234567890\nlast line\n")
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", __file__]))
@@ -95,6 +95,25 @@ def test_arrow_to_numpy():
     )
 
 
+def test_arrow_to_numpy_zero_copy():
+    # Single-chunk columns without nulls are converted without copying.
+    input_data = pa.table({"column_1": [1, 2, 3, 4], "column_2": [1.0, None, 3.0, 4.0]})
+    actual_output = _convert_batch_type_to_numpy(input_data)
+    assert np.shares_memory(
+        actual_output["column_1"], input_data["column_1"].chunk(0).to_numpy()
+    )
+    np.testing.assert_array_equal(
+        actual_output["column_2"], np.array([1.0, np.nan, 3.0, 4.0])
+    )
+
+    # Multi-chunk columns are combined.
+    input_data = pa.Table.from_batches(
+        [pa.record_batch([pa.array([1, 2])], names=["column_1"])] * 2
+    )
+    actual_output = _convert_batch_type_to_numpy(input_data)
+    np.testing.assert_array_equal(actual_output["column_1"], np.array([1, 2, 1, 2]))
+
+
 def test_pd_dataframe_to_numpy():
     input_data = pd.DataFrame({"column_1": [1, 2, 3, 4]})
     expected_output = np.array([1, 2, 3, 4])
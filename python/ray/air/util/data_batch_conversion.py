@@ -118,10 +118,7 @@ def convert_pandas_to_batch_type(
             return data.iloc[:, 0].to_numpy()
         else:
             # Else return as a dict of numpy arrays.
-            output_dict = {}
-            for column in data:
-                output_dict[column] = data[column].to_numpy()
-            return output_dict
+            return {column: series.to_numpy() for column, series in data.items()}
 
     elif type == BatchFormat.ARROW:
         if not pyarrow:
@@ -181,14 +178,18 @@ def _convert_batch_type_to_numpy(
             )
         else:
             output_dict = {}
-            for col_name in data.column_names:
-                col = data[col_name]
+            for col_name, col in zip(data.column_names, data.itercolumns()):
                 if col.num_chunks == 0:
                     col = pyarrow.array([], type=col.type)
                 elif _is_column_extension_type(col):
                     # Arrow’s incorrect concatenation of extension arrays:
                     # https://issues.apache.org/jira/browse/ARROW-16503
                     col = _concatenate_extension_column(col)
+                elif col.num_chunks == 1:
+                    # Use the chunk as is, so that to_numpy() can return a zero-copy
+                    # view of it if possible (i.e. if it has no nulls and is of a
+                    # primitive type).
+                    col = col.chunk(0)
                 else:
                     col = col.combine_chunks()
                 output_dict[col_name] = col.to_numpy(zero_copy_only=False)
@@ -6,3 +6,5 @@ from ray.util.annotations import DeveloperAPI
 @DeveloperAPI
 class DAGNodeBase:
     """Common base class for a node in a Ray task graph."""
+
+    __slots__ = ()
@@ -9,7 +9,7 @@ from ray.dag.constants import (
 )
 from ray.util.annotations import DeveloperAPI
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 
 @DeveloperAPI
@@ -26,6 +26,11 @@ class ClassNode(DAGNode):
     ):
         self._body = cls
         self._last_call: Optional["ClassMethodNode"] = None
+        self._unbound_methods: Dict[str, "_UnboundClassMethodNode"] = {}
+        # Created lazily, see _get_body_attrs().
+        self._body_attrs: Optional[FrozenSet[str]] = None
+        # Created lazily, see _get_remote_cls().
+        self._remote_cls: Optional[ray.actor.ActorClass] = None
         super().__init__(
             cls_args,
             cls_kwargs,
@@ -48,13 +53,22 @@ class ClassNode(DAGNode):
         new_options: Dict[str, Any],
         new_other_args_to_resolve: Dict[str, Any],
     ):
-        return ClassNode(
+        node = ClassNode(
             self._body,
             new_args,
             new_kwargs,
             new_options,
             other_args_to_resolve=new_other_args_to_resolve,
         )
+        # Executing a DAG executes copies of its nodes, so share the remote class
+        # with the copy to only create it once per bound node.
+        node._remote_cls = self._get_remote_cls()
+        return node
+
+    def _get_remote_cls(self) -> ray.actor.ActorClass:
+        if self._remote_cls is None:
+            self._remote_cls = ray.remote(self._body)
+        return self._remote_cls
 
     def _execute_impl(self, *args, **kwargs):
         """Executor of ClassNode by ray.remote()
@@ -65,7 +79,7 @@ class ClassNode(DAGNode):
         current node is executed.
         """
         return (
-            ray.remote(self._body)
+            self._get_remote_cls()
             .options(**self._bound_options)
             .remote(*self._bound_args, **self._bound_kwargs)
         )
@@ -74,21 +88,45 @@ class ClassNode(DAGNode):
         """Check if InputNode is used in children DAGNodes with current node
         as the root.
         """
-        children_dag_nodes = self._get_all_child_nodes()
-        for child in children_dag_nodes:
-            if isinstance(child, InputNode):
-                return True
-        return False
+        # Reads the cached children directly: the scan is shared with later
+        # traversals of this node, and no copy of the list is needed.
+        return any(
+            isinstance(child, InputNode) for child in self._get_cached_child_nodes()
+        )
 
     def __getattr__(self, method_name: str):
         # User trying to call .bind() without a bind class method
-        if method_name == "bind" and "bind" not in dir(self._body):
+        if method_name == "bind" and "bind" not in self._get_body_attrs():
             raise AttributeError(f".bind() cannot be used again on {type(self)} ")
-        # Raise an error if the method is invalid.
-        getattr(self._body, method_name)
-        call_node = _UnboundClassMethodNode(self, method_name)
+        # Dunder lookups that get here come from Python protocols probing for
+        # optional hooks (e.g. copy's __deepcopy__), not from binding actor
+        # methods, so fail fast without looking them up on the actor class.
+        # __call__ is the exception, since it's commonly bound in deployment graphs.
+        if (
+            method_name.startswith("__")
+            and method_name.endswith("__")
+            and method_name != "__call__"
+        ):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{method_name}'"
+            )
+        call_node = self._unbound_methods.get(method_name)
+        if call_node is None:
+            # Raise an error if the method is invalid. Names listed by dir()
+            # exist, so only probe (and get the native error) for the rest.
+            if method_name not in self._get_body_attrs():
+                getattr(self._body, method_name)
+            call_node = _UnboundClassMethodNode(self, method_name)
+            # Unbound methods are immutable, so they can be reused across lookups.
+            self._unbound_methods[method_name] = call_node
         return call_node
 
+    def _get_body_attrs(self) -> FrozenSet[str]:
+        """Return the attribute names of the actor class, computed once."""
+        if self._body_attrs is None:
+            self._body_attrs = frozenset(dir(self._body))
+        return self._body_attrs
+
     def __str__(self) -> str:
         return get_dag_node_str(self, str(self._body))
 
@@ -124,10 +162,17 @@ class ClassNode(DAGNode):
 
 
 class _UnboundClassMethodNode(object):
-    def __init__(self, actor: ClassNode, method_name: str):
+    __slots__ = ("_actor", "_method_name", "_options")
+
+    def __init__(
+        self,
+        actor: ClassNode,
+        method_name: str,
+        options: Optional[Dict[str, Any]] = None,
+    ):
         self._actor = actor
         self._method_name = method_name
-        self._options = {}
+        self._options = options or {}
 
     def bind(self, *args, **kwargs):
         other_args_to_resolve = {
@@ -155,8 +200,8 @@ class _UnboundClassMethodNode(object):
             return self.__getattribute__(attr)
 
     def options(self, **options):
-        self._options = options
-        return self
+        # Return a new node rather than mutating this one, which may be shared.
+        return _UnboundClassMethodNode(self._actor, self._method_name, options)
 
 
 @DeveloperAPI
@@ -171,10 +216,6 @@ class ClassMethodNode(DAGNode):
         method_options: Dict[str, Any],
         other_args_to_resolve: Dict[str, Any],
     ):
-
-        self._bound_args = method_args or []
-        self._bound_kwargs = method_kwargs or {}
-        self._bound_options = method_options or {}
         self._method_name: str = method_name
         # Parse other_args_to_resolve and assign to variables
         self._parent_class_node: ClassNode = other_args_to_resolve.get(
@@ -185,9 +226,9 @@ class ClassMethodNode(DAGNode):
         self._prev_class_method_call: Optional[
             ClassMethodNode
         ] = other_args_to_resolve.get(PREV_CLASS_METHOD_CALL_KEY, None)
-        # The actor creation task dependency is encoded as the first argument,
-        # and the ordering dependency as the second, which ensures they are
-        # executed prior to this node.
+        # The actor creation task and ordering dependencies are passed through
+        # other_args_to_resolve rather than the bound args, which ensures they are
+        # executed prior to this node while the bound args are passed as is.
         super().__init__(
             method_args,
             method_kwargs,
@@ -219,8 +260,11 @@ class ClassMethodNode(DAGNode):
         current node is executed.
         """
         method_body = getattr(self._parent_class_node, self._method_name)
+        # Skip building an options wrapper per call when there's nothing to set.
+        if self._bound_options:
+            method_body = method_body.options(**self._bound_options)
         # Execute with bound args.
-        return method_body.options(**self._bound_options).remote(
+        return method_body.remote(
             *self._bound_args,
             **self._bound_kwargs,
         )
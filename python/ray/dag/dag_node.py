@@ -29,6 +29,20 @@ class DAGNode(DAGNodeBase):
     or class method)
     """
 
+    # Subclasses that don't define __slots__ still get an instance __dict__.
+    __slots__ = (
+        "_bound_args",
+        "_bound_kwargs",
+        "_bound_options",
+        "_bound_other_args_to_resolve",
+        "_cached_stable_uuid",
+        "cache_from_last_execute",
+        "_cached_topo_order",
+        "_cached_child_nodes",
+        "_cached_scanner",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         args: Tuple[Any],
@@ -54,10 +68,20 @@ class DAGNode(DAGNodeBase):
         self._bound_other_args_to_resolve: Optional[Dict[str, Any]] = (
             other_args_to_resolve or {}
         )
-        # UUID that is not changed over copies of this node.
-        self._stable_uuid = uuid.uuid4().hex
+        # UUID that is not changed over copies of this node. Generated on first
+        # access, as copies are assigned the UUID of their source right away.
+        self._cached_stable_uuid: Optional[str] = None
         # Cached values from last call to execute()
         self.cache_from_last_execute = {}
+        # Unique nodes of the DAG rooted at this node in leaf-to-root order,
+        # computed on the first call to execute().
+        self._cached_topo_order: Optional[List["DAGNode"]] = None
+        # DAGNodes bound in the args of this node, computed on first use by
+        # _get_all_child_nodes(). Bound args are not mutated after binding.
+        self._cached_child_nodes: Optional[List["DAGNode"]] = None
+        # Scanner that found the cached child nodes. It is kept so that
+        # replacing the children on each execution doesn't rescan the args.
+        self._cached_scanner: Optional[_PyObjScanner] = None
 
     def get_args(self) -> Tuple[Any]:
         """Return the tuple of arguments for this node."""
@@ -85,6 +109,16 @@ class DAGNode(DAGNodeBase):
         """
         return self._stable_uuid
 
+    @property
+    def _stable_uuid(self) -> str:
+        if self._cached_stable_uuid is None:
+            self._cached_stable_uuid = uuid.uuid4().hex
+        return self._cached_stable_uuid
+
+    @_stable_uuid.setter
+    def _stable_uuid(self, value: str):
+        self._cached_stable_uuid = value
+
     async def get_object_refs_from_last_execute(self) -> Dict[str, Any]:
         """Gets cached object refs from the last call to execute().
 
@@ -116,13 +150,66 @@ class DAGNode(DAGNodeBase):
                 - resolved values representing user input at runtime
         """
 
-        def executor(node):
-            return node._execute_impl(*args, **kwargs)
-
-        result = self.apply_recursive(executor)
+        results = {}
+        for node in self._topo_order():
+            # Children come earlier in the order, so their results are ready.
+            if node._is_leaf():
+                resolved_node = node
+            else:
+                resolved_node = node._apply_and_replace_all_child_nodes(
+                    lambda child: results[child._stable_uuid]
+                )
+            results[node._stable_uuid] = resolved_node._execute_impl(*args, **kwargs)
         if _ray_cache_refs:
-            self.cache_from_last_execute = executor.cache
-        return result
+            self.cache_from_last_execute = results
+        return results[self._stable_uuid]
+
+    def _topo_order(self) -> List["DAGNode"]:
+        """Return the unique nodes of this DAG in leaf-to-root order.
+
+        Nodes are de-duplicated by stable uuid, so a shared child is listed
+        once before all of its parents. The order is computed once and cached
+        on this node.
+        """
+        if self._cached_topo_order is not None:
+            return self._cached_topo_order
+
+        order = []
+        visited = set()
+        input_node_uuid = None
+        # Iterative post-order DFS; the flag marks nodes whose children have
+        # all been emitted already.
+        stack = [(self, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if children_done:
+                order.append(node)
+                continue
+            if node._stable_uuid in visited:
+                continue
+            visited.add(node._stable_uuid)
+            if type(node).__name__ == "InputNode":
+                if not input_node_uuid:
+                    input_node_uuid = node._stable_uuid
+                elif input_node_uuid != node._stable_uuid:
+                    raise AssertionError(
+                        "Each DAG should only have one unique InputNode."
+                    )
+            stack.append((node, True))
+            for child in reversed(node._get_cached_child_nodes()):
+                if child._stable_uuid not in visited:
+                    stack.append((child, False))
+
+        self._cached_topo_order = order
+        return order
+
+    def _is_leaf(self) -> bool:
+        """Return whether no DAGNode is bound in the args of this node.
+
+        Leaves have nothing to replace, so traversals skip scanning and
+        copying their args.
+        """
+        return not self._get_cached_child_nodes()
 
     def _get_toplevel_child_nodes(self) -> List["DAGNode"]:
         """Return the list of nodes specified as top-level args.
@@ -162,21 +249,26 @@ class DAGNode(DAGNodeBase):
             f.remote(a, [b], key={"nested": [c]}) -> [a, b, c]
         """
 
-        scanner = _PyObjScanner()
-        # we use List instead of Set here, reason explained
-        # in `_get_toplevel_child_nodes`.
-        children = []
-        for n in scanner.find_nodes(
-            [
-                self._bound_args,
-                self._bound_kwargs,
-                self._bound_other_args_to_resolve,
-            ]
-        ):
-            if n not in children:
-                children.append(n)
-        scanner.clear()
-        return children
+        return list(self._get_cached_child_nodes())
+
+    def _get_cached_child_nodes(self) -> List["DAGNode"]:
+        """Same as ``_get_all_child_nodes()``, but returns the cached list
+        itself, which must not be mutated.
+        """
+        if self._cached_child_nodes is None:
+            scanner = _PyObjScanner()
+            # we use List instead of Set here, reason explained
+            # in `_get_toplevel_child_nodes`. The scanner returns each
+            # node once.
+            self._cached_child_nodes = scanner.find_nodes(
+                [
+                    self._bound_args,
+                    self._bound_kwargs,
+                    self._bound_other_args_to_resolve,
+                ]
+            )
+            self._cached_scanner = scanner
+        return self._cached_child_nodes
 
     def _apply_and_replace_all_child_nodes(
         self, fn: "Callable[[DAGNode], T]"
@@ -193,25 +285,15 @@ class DAGNode(DAGNodeBase):
             New DAGNode after replacing all child nodes.
         """
 
-        replace_table = {}
-        # CloudPickler scanner object for current layer of DAGNode. Same
-        # scanner should be use for a full find & replace cycle.
-        scanner = _PyObjScanner()
-        # Find all first-level nested DAGNode children in args.
-        # Update replacement table and execute the replace.
-        for node in scanner.find_nodes(
-            [
-                self._bound_args,
-                self._bound_kwargs,
-                self._bound_other_args_to_resolve,
-            ]
-        ):
-            if node not in replace_table:
-                replace_table[node] = fn(node)
-        new_args, new_kwargs, new_other_args_to_resolve = scanner.replace_nodes(
-            replace_table
-        )
-        scanner.clear()
+        # Find all first-level nested DAGNode children in args once, then
+        # update replacement table and execute the replace with the scanner
+        # of that scan.
+        replace_table = {node: fn(node) for node in self._get_cached_child_nodes()}
+        (
+            new_args,
+            new_kwargs,
+            new_other_args_to_resolve,
+        ) = self._cached_scanner.replace_nodes(replace_table)
 
         # Return updated copy of self.
         return self._copy(
@@ -251,6 +333,23 @@ class DAGNode(DAGNodeBase):
 
         if not type(fn).__name__ == "_CachingFn":
             fn = _CachingFn(fn)
+        elif self._stable_uuid in fn.cache:
+            # Shared subgraphs (e.g. an InputNode fanned out to several
+            # branches) are only scanned and copied the first time they are
+            # reached, otherwise diamonds make the walk exponential.
+            return fn.cache[self._stable_uuid]
+
+        if self._is_leaf():
+            # There's nothing to replace, but fn still gets a copy as for any other
+            # node, so that transforms can't mutate the original DAG.
+            return fn(
+                self._copy(
+                    self._bound_args,
+                    self._bound_kwargs,
+                    self.get_options(),
+                    self._bound_other_args_to_resolve,
+                )
+            )
 
         return fn(
             self._apply_and_replace_all_child_nodes(
@@ -320,6 +419,14 @@ class DAGNode(DAGNodeBase):
             new_args, new_kwargs, new_options, new_other_args_to_resolve
         )
         instance._stable_uuid = self._stable_uuid
+        if (
+            new_args is self._bound_args
+            and new_kwargs is self._bound_kwargs
+            and new_other_args_to_resolve is self._bound_other_args_to_resolve
+        ):
+            # Only the options changed, so the children are the same.
+            instance._cached_child_nodes = self._cached_child_nodes
+            instance._cached_scanner = self._cached_scanner
         return instance
 
     def __reduce__(self):
@@ -1,4 +1,4 @@
-from ray.dag import DAGNode
+from ray.dag.dag_node import DAGNode
 from ray.util.annotations import DeveloperAPI
 
 
@@ -26,6 +26,16 @@ def _get_indentation(num_spaces=4):
     return " " * num_spaces
 
 
+def _indent_lines(obj, indent):
+    """Return the lines of ``str(obj)``, each prefixed with indent."""
+    return [indent + line for line in str(obj).split("\n")]
+
+
+def _join_block(lines, opening, closing, indent):
+    """Join lines into a block with each line on its own indented row."""
+    return "".join([opening, *(f"\n{indent}{line}" for line in lines), closing])
+
+
 def _get_args_lines(bound_args):
     """Pretty prints bounded args of a DAGNode, and recursively handle
     DAGNode in list / dict containers.
@@ -34,32 +44,20 @@ def _get_args_lines(bound_args):
     lines = []
     for arg in bound_args:
         if isinstance(arg, DAGNode):
-            node_repr_lines = str(arg).split("\n")
-            for node_repr_line in node_repr_lines:
-                lines.append(f"{indent}" + node_repr_line)
+            lines.extend(_indent_lines(arg, indent))
         elif isinstance(arg, list):
             for ele in arg:
-                node_repr_lines = str(ele).split("\n")
-                for node_repr_line in node_repr_lines:
-                    lines.append(f"{indent}" + node_repr_line)
+                lines.extend(_indent_lines(ele, indent))
         elif isinstance(arg, dict):
-            for _, val in arg.items():
-                node_repr_lines = str(val).split("\n")
-                for node_repr_line in node_repr_lines:
-                    lines.append(f"{indent}" + node_repr_line)
+            for val in arg.values():
+                lines.extend(_indent_lines(val, indent))
         # TODO: (jiaodong) Handle nested containers and other obj types
         else:
             lines.append(f"{indent}" + str(arg) + ", ")
 
     if len(lines) == 0:
-        args_line = "[]"
-    else:
-        args_line = "["
-        for args in lines:
-            args_line += f"\n{indent}{args}"
-        args_line += f"\n{indent}]"
-
-    return args_line
+        return "[]"
+    return _join_block(lines, "[", f"\n{indent}]", indent)
 
 
 def _get_kwargs_lines(bound_kwargs):
@@ -74,37 +72,23 @@ def _get_kwargs_lines(bound_kwargs):
     for key, val in bound_kwargs.items():
         if isinstance(val, DAGNode):
             node_repr_lines = str(val).split("\n")
-            for index, node_repr_line in enumerate(node_repr_lines):
-                if index == 0:
-                    kwargs_lines.append(
-                        f"{indent}{key}:" + f"{indent}" + node_repr_line
-                    )
-                else:
-                    kwargs_lines.append(f"{indent}{indent}" + node_repr_line)
-
+            kwargs_lines.append(f"{indent}{key}:{indent}{node_repr_lines[0]}")
+            kwargs_lines.extend(
+                f"{indent}{indent}{line}" for line in node_repr_lines[1:]
+            )
         elif isinstance(val, list):
             for ele in val:
-                node_repr_lines = str(ele).split("\n")
-                for node_repr_line in node_repr_lines:
-                    kwargs_lines.append(f"{indent}" + node_repr_line)
+                kwargs_lines.extend(_indent_lines(ele, indent))
         elif isinstance(val, dict):
-            for _, inner_val in val.items():
-                node_repr_lines = str(inner_val).split("\n")
-                for node_repr_line in node_repr_lines:
-                    kwargs_lines.append(f"{indent}" + node_repr_line)
+            for inner_val in val.values():
+                kwargs_lines.extend(_indent_lines(inner_val, indent))
         # TODO: (jiaodong) Handle nested containers and other obj types
         else:
             kwargs_lines.append(val)
 
-    if len(kwargs_lines) > 0:
-        kwargs_line = "{"
-        for line in kwargs_lines:
-            kwargs_line += f"\n{indent}{line}"
-        kwargs_line += f"\n{indent}}}"
-    else:
-        kwargs_line = "{}"
-
-    return kwargs_line
+    if len(kwargs_lines) == 0:
+        return "{}"
+    return _join_block(kwargs_lines, "{", f"\n{indent}}}", indent)
 
 
 def _get_options_lines(bound_options):
@@ -112,16 +96,10 @@ def _get_options_lines(bound_options):
     if not bound_options:
         return "{}"
     indent = _get_indentation()
-    options_lines = []
-    for key, val in bound_options.items():
-        if val:
-            options_lines.append(f"{indent}{key}: " + str(val))
-
-    options_line = "{"
-    for line in options_lines:
-        options_line += f"\n{indent}{line}"
-    options_line += f"\n{indent}}}"
-    return options_line
+    options_lines = [
+        f"{indent}{key}: " + str(val) for key, val in bound_options.items() if val
+    ]
+    return _join_block(options_lines, "{", f"\n{indent}}}", indent)
 
 
 def _get_other_args_to_resolve_lines(other_args_to_resolve):
@@ -132,24 +110,13 @@ def _get_other_args_to_resolve_lines(other_args_to_resolve):
     for key, val in other_args_to_resolve.items():
         if isinstance(val, DAGNode):
             node_repr_lines = str(val).split("\n")
-            for index, node_repr_line in enumerate(node_repr_lines):
-                if index == 0:
-                    other_args_to_resolve_lines.append(
-                        f"{indent}{key}:"
-                        + f"{indent}"
-                        + "\n"
-                        + f"{indent}{indent}{indent}"
-                        + node_repr_line
-                    )
-                else:
-                    other_args_to_resolve_lines.append(
-                        f"{indent}{indent}" + node_repr_line
-                    )
+            other_args_to_resolve_lines.append(
+                f"{indent}{key}:{indent}\n{indent}{indent}{indent}{node_repr_lines[0]}"
+            )
+            other_args_to_resolve_lines.extend(
+                f"{indent}{indent}{line}" for line in node_repr_lines[1:]
+            )
         else:
             other_args_to_resolve_lines.append(f"{indent}{key}: " + str(val))
 
-    other_args_to_resolve_line = "{"
-    for line in other_args_to_resolve_lines:
-        other_args_to_resolve_line += f"\n{indent}{line}"
-    other_args_to_resolve_line += f"\n{indent}}}"
-    return other_args_to_resolve_line
+    return _join_block(other_args_to_resolve_lines, "{", f"\n{indent}}}", indent)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 
 import ray
@@ -21,6 +21,8 @@ class FunctionNode(DAGNode):
         other_args_to_resolve=None,
     ):
         self._body = func_body
+        # Created lazily, see _get_remote_fn().
+        self._remote_fn: Optional[ray.remote_function.RemoteFunction] = None
         super().__init__(
             func_args,
             func_kwargs,
@@ -35,13 +37,23 @@ class FunctionNode(DAGNode):
         new_options: Dict[str, Any],
         new_other_args_to_resolve: Dict[str, Any],
     ):
-        return FunctionNode(
+        node = FunctionNode(
             self._body,
             new_args,
             new_kwargs,
             new_options,
             other_args_to_resolve=new_other_args_to_resolve,
         )
+        # Executing a DAG executes copies of its nodes, so share the remote
+        # function with the copy to only create (and export) it once per bound
+        # node.
+        node._remote_fn = self._get_remote_fn()
+        return node
+
+    def _get_remote_fn(self) -> "ray.remote_function.RemoteFunction":
+        if self._remote_fn is None:
+            self._remote_fn = ray.remote(self._body)
+        return self._remote_fn
 
     def _execute_impl(self, *args, **kwargs):
         """Executor of FunctionNode by ray.remote().
@@ -51,11 +63,11 @@ class FunctionNode(DAGNode):
         with value in bound_args and bound_kwargs via bottom-up recursion when
         current node is executed.
         """
-        return (
-            ray.remote(self._body)
-            .options(**self._bound_options)
-            .remote(*self._bound_args, **self._bound_kwargs)
-        )
+        remote_fn = self._get_remote_fn()
+        # Skip building an options wrapper per call when there's nothing to set.
+        if self._bound_options:
+            remote_fn = remote_fn.options(**self._bound_options)
+        return remote_fn.remote(*self._bound_args, **self._bound_kwargs)
 
     def __str__(self) -> str:
         return get_dag_node_str(self, str(self._body))
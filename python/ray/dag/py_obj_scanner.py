@@ -1,52 +1,28 @@
-import io
-import sys
-from typing import Generic, List, Dict, Any, Type, TypeVar
-
-# For python < 3.8 we need to explicitly use pickle5 to support protocol 5
-if sys.version_info < (3, 8):
-    try:
-        import pickle5 as pickle  # noqa: F401
-    except ImportError:
-        import pickle  # noqa: F401
-else:
-    import pickle  # noqa: F401
-
-import ray
-from ray.dag.base import DAGNodeBase
+import itertools
+from typing import Generic, List, Dict, Any, Type, TypeVar, Set
 
+from ray.dag.base import DAGNodeBase
 
-# Used in deserialization hooks to reference scanner instances.
-_instances: Dict[int, "_PyObjScanner"] = {}
 
 # Generic types for the scanner to transform from and to.
 SourceType = TypeVar("SourceType")
 TransformedType = TypeVar("TransformedType")
 
+# Containers that are walked into. These are exactly the types pickle
+# serializes structurally (without consulting ``reducer_override``), so any
+# other object is treated as opaque and kept by reference.
+_CONTAINER_TYPES = frozenset((list, tuple, dict, set, frozenset))
 
-def _get_node(instance_id: int, node_index: int) -> SourceType:
-    """Get the node instance.
-
-    Note: This function should be static and globally importable,
-    otherwise the serialization overhead would be very significant.
-    """
-    return _instances[instance_id]._replace_index(node_index)
-
-
-def _get_object(instance_id: int, node_index: int) -> Any:
-    """Used to get arbitrary object other than SourceType.
-
-    Note: This function should be static and globally importable,
-    otherwise the serialization overhead would be very significant.
-    """
-    return _instances[instance_id]._objects[node_index]
 
-
-class _PyObjScanner(ray.cloudpickle.CloudPickler, Generic[SourceType, TransformedType]):
+class _PyObjScanner(Generic[SourceType, TransformedType]):
     """Utility to find and replace the `source_type` in Python objects.
 
-    This uses pickle to walk the PyObj graph and find first-level DAGNode
-    instances on ``find_nodes()``. The caller can then compute a replacement
-    table and then replace the nodes via ``replace_nodes()``.
+    This walks the builtin containers (list, tuple, dict, set, frozenset) of
+    the PyObj graph and finds first-level DAGNode instances on
+    ``find_nodes()``. The caller can then compute a replacement table and
+    then replace the nodes via ``replace_nodes()``, which may be called
+    repeatedly with different tables. Only the containers on the path to a
+    found node are copied; everything else is passed through as-is.
 
     Args:
         source_type: the type of object to find and replace. Default to DAGNodeBase.
@@ -54,37 +30,17 @@ class _PyObjScanner(ray.cloudpickle.CloudPickler, Generic[SourceType, Transforme
 
     def __init__(self, source_type: Type = DAGNodeBase):
         self.source_type = source_type
-        # Buffer to keep intermediate serialized state.
-        self._buf = io.BytesIO()
-        # List of top-level SourceType found during the serialization pass.
-        self._found = None
-        # List of other objects found during the serialization pass.
-        # This is used to store references to objects so they won't be
-        # serialized by cloudpickle.
-        self._objects = []
-        # Replacement table to consult during deserialization.
-        self._replace_table: Dict[SourceType, TransformedType] = None
-        _instances[id(self)] = self
-        super().__init__(self._buf)
-
-    def reducer_override(self, obj):
-        """Hook for reducing objects.
-
-        The function intercepts serialization of all objects and store them
-        to internal data structures, preventing actually writing them to
-        the buffer.
-        """
-        if obj is _get_node or obj is _get_object:
-            # Only fall back to cloudpickle for these two functions.
-            return super().reducer_override(obj)
-        elif isinstance(obj, self.source_type):
-            index = len(self._found)
-            self._found.append(obj)
-            return _get_node, (id(self), index)
-        else:
-            index = len(self._objects)
-            self._objects.append(obj)
-            return _get_object, (id(self), index)
+        # Object passed to the last ``find_nodes()`` call.
+        self._obj = None
+        # List of top-level SourceType found during the scan.
+        self._found: List[SourceType] = None
+        # Ids of the found SourceType, used to de-duplicate them.
+        self._found_ids: Set[int] = set()
+        # Ids of the containers already scanned.
+        self._visited: Set[int] = set()
+        # Ids of the containers that (transitively) hold a SourceType and
+        # thus need to be copied on replacement.
+        self._dirty: Set[int] = set()
 
     def find_nodes(self, obj: Any) -> List[SourceType]:
         """Find top-level DAGNodes."""
@@ -92,24 +48,79 @@ class _PyObjScanner(ray.cloudpickle.CloudPickler, Generic[SourceType, Transforme
             self._found is None
         ), "find_nodes cannot be called twice on the same PyObjScanner instance."
         self._found = []
-        self._objects = []
-        self.dump(obj)
+        self._obj = obj
+        self._scan(obj)
         return self._found
 
     def replace_nodes(self, table: Dict[SourceType, TransformedType]) -> Any:
         """Replace previously found DAGNodes per the given table."""
         assert self._found is not None, "find_nodes must be called first"
-        self._replace_table = table
-        self._buf.seek(0)
-        return pickle.load(self._buf)
-
-    def _replace_index(self, i: int) -> SourceType:
-        return self._replace_table[self._found[i]]
+        return self._replace(self._obj, table, {})
+
+    def _scan(self, obj: Any) -> bool:
+        """Record the SourceType in obj, returning whether there was any."""
+        if isinstance(obj, self.source_type):
+            if id(obj) not in self._found_ids:
+                self._found_ids.add(id(obj))
+                self._found.append(obj)
+            return True
+        obj_type = type(obj)
+        if obj_type not in _CONTAINER_TYPES:
+            return False
+        obj_id = id(obj)
+        if obj_id in self._visited:
+            return obj_id in self._dirty
+        self._visited.add(obj_id)
+
+        if obj_type is dict:
+            items = itertools.chain.from_iterable(obj.items())
+        else:
+            items = obj
+        found = False
+        for item in items:
+            # Don't short-circuit: every SourceType needs to be recorded.
+            if self._scan(item):
+                found = True
+        if found:
+            self._dirty.add(obj_id)
+        return found
+
+    def _replace(
+        self,
+        obj: Any,
+        table: Dict[SourceType, TransformedType],
+        memo: Dict[int, Any],
+    ) -> Any:
+        if isinstance(obj, self.source_type):
+            return table[obj]
+        obj_id = id(obj)
+        if obj_id not in self._dirty:
+            return obj
+        if obj_id in memo:
+            return memo[obj_id]
+
+        obj_type = type(obj)
+        if obj_type is list:
+            # Memoize before filling so that shared and self-referencing
+            # lists are preserved in the copy.
+            new_obj = memo[obj_id] = []
+            new_obj.extend(self._replace(item, table, memo) for item in obj)
+        elif obj_type is dict:
+            new_obj = memo[obj_id] = {}
+            for key, value in obj.items():
+                new_obj[self._replace(key, table, memo)] = self._replace(
+                    value, table, memo
+                )
+        else:
+            new_obj = memo[obj_id] = obj_type(
+                self._replace(item, table, memo) for item in obj
+            )
+        return new_obj
 
     def clear(self):
-        """Clear the scanner from the _instances"""
-        if id(self) in _instances:
-            del _instances[id(self)]
-
-    def __del__(self):
-        self.clear()
+        """Drop references to the scanned objects to make them GCable."""
+        self._obj = None
+        self._found = []
+        self._found_ids.clear()
+        self._visited.clear()
+        self._dirty.clear()
@@ -112,6 +112,26 @@ def test_actor_method_options(shared_ray_instance):
     assert ray.get(dag.execute()) == 10
     assert dag.get_options().get("name") == "actor_method_options"
 
+    # Options only apply to the call they're set on.
+    plain_dag = a1.get.bind()
+    assert plain_dag.get_options() == {}
+    assert ray.get(plain_dag.execute()) == 10
+
+
+def test_actor_dunder_method(shared_ray_instance):
+    @ray.remote
+    class Callable:
+        def __call__(self, x):
+            return x
+
+    a1 = Callable.bind()
+    # Protocol dunders aren't looked up as actor methods.
+    assert not hasattr(a1, "__deepcopy__")
+    assert not hasattr(a1, "__len__")
+    # But __call__ can still be bound.
+    dag = a1.__call__.bind(1)
+    assert ray.get(dag.execute()) == 1
+
 
 def test_basic_actor_dag_constructor_invalid_options(shared_ray_instance):
     with pytest.raises(
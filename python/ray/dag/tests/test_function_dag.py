@@ -172,6 +172,28 @@ def test_nested_args(shared_ray_instance):
     assert ray.get(ct.get.remote()) == 4
 
 
+def test_apply_recursive_copies_nodes(shared_ray_instance):
+    @ray.remote
+    def a(*args):
+        pass
+
+    leaf = a.bind(1)
+    dag = a.bind(leaf)
+    applied_to = []
+
+    def fn(node):
+        applied_to.append(node)
+        # Transforms may mutate the nodes they're given.
+        node._bound_args = ("mutated",)
+        return node
+
+    dag.apply_recursive(fn)
+    assert len(applied_to) == 2
+    assert all(node is not leaf and node is not dag for node in applied_to)
+    assert leaf.get_args() == (1,)
+    assert dag.get_args() == (leaf,)
+
+
 def test_dag_options(shared_ray_instance):
     @ray.remote(num_gpus=100)
     def foo():
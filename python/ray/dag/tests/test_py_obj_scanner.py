@@ -1,4 +1,6 @@
-from ray.dag.py_obj_scanner import _PyObjScanner, _instances
+import weakref
+
+from ray.dag.py_obj_scanner import _PyObjScanner
 import pytest
 
 
@@ -35,18 +37,7 @@ def test_not_serializing_objects():
 
 
 def test_scanner_clear():
-    """Test scanner clear to make the scanner GCable"""
-    prev_len = len(_instances)
-
-    def call_find_nodes():
-        scanner = _PyObjScanner(source_type=Source)
-        my_objs = [Source(), [Source(), {"key": Source()}]]
-        scanner.find_nodes(my_objs)
-        scanner.clear()
-        assert id(scanner) not in _instances
-
-    call_find_nodes()
-    assert prev_len == len(_instances)
+    """Test scanner clear to make the scanned objects GCable"""
 
     def call_find_and_replace_nodes():
         scanner = _PyObjScanner(source_type=Source)
@@ -54,10 +45,40 @@ def test_scanner_clear():
         found = scanner.find_nodes(my_objs)
         scanner.replace_nodes({obj: 1 for obj in found})
         scanner.clear()
-        assert id(scanner) not in _instances
+        return scanner, weakref.ref(my_objs[0])
+
+    scanner, ref = call_find_and_replace_nodes()
+    assert ref() is None
+
+
+def test_replace_copies_only_paths_to_nodes():
+    scanner = _PyObjScanner(source_type=Source)
+    untouched = [1, 2, {"a": 3}]
+    shared = [Source()]
+    my_objs = ({"untouched": untouched, "nodes": [shared, shared]}, (Source(),))
+
+    found = scanner.find_nodes(my_objs)
+    assert len(found) == 2
+
+    replaced = scanner.replace_nodes({obj: 1 for obj in found})
+    scanner.clear()
+    assert replaced == ({"untouched": untouched, "nodes": [[1], [1]]}, (1,))
+    assert replaced[0]["untouched"] is untouched
+    # Aliasing of containers is preserved in the copy.
+    assert replaced[0]["nodes"][0] is replaced[0]["nodes"][1]
+    # The inputs are not mutated.
+    assert isinstance(shared[0], Source)
 
-    call_find_and_replace_nodes()
-    assert prev_len == len(_instances)
+
+def test_replace_nodes_repeatedly():
+    scanner = _PyObjScanner(source_type=Source)
+    source = Source()
+    my_objs = [source, {"key": source}]
+
+    found = scanner.find_nodes(my_objs)
+    assert scanner.replace_nodes({source: 1}) == [1, {"key": 1}]
+    assert scanner.replace_nodes({source: 2}) == [2, {"key": 2}]
+    assert found == [source]
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import itertools
 from typing import Dict
 
 from ray.dag import (
@@ -17,7 +18,8 @@ class _DAGNodeNameGenerator(object):
     """
 
     def __init__(self):
-        self.name_to_suffix: Dict[str, int] = dict()
+        # Counter of the next suffix for each name seen so far.
+        self.name_to_suffix: Dict[str, itertools.count] = dict()
 
     def get_node_name(self, node: DAGNode):
         # InputNode should be unique.
@@ -33,31 +35,31 @@ class _DAGNodeNameGenerator(object):
             node_name = node.get_options().get("name", None) or node._method_name
         elif isinstance(node, (ClassNode, FunctionNode)):
             node_name = node.get_options().get("name", None) or node._body.__name__
-        # we use instance class name check here to avoid importing ServeNodes as
-        # serve components are not included in Ray Core.
-        elif type(node).__name__ in ("DeploymentNode", "DeploymentFunctionNode"):
-            node_name = node.get_deployment_name()
-        elif type(node).__name__ == "DeploymentMethodNode":
-            node_name = node.get_deployment_method_name()
-        elif type(node).__name__ == "DeploymentExecutorNode":
-            node_name = node._deployment_handle.deployment_name
-        elif type(node).__name__ == "DeploymentMethodExecutorNode":
-            node_name = node._deployment_method_name
-        elif type(node).__name__ == "DeploymentFunctionExecutorNode":
-            node_name = node._deployment_function_handle.deployment_name
         else:
-            raise ValueError(
-                "get_node_name() should only be called on DAGNode instances."
-            )
+            # we use instance class name check here to avoid importing ServeNodes
+            # as serve components are not included in Ray Core.
+            node_type_name = type(node).__name__
+            if node_type_name in ("DeploymentNode", "DeploymentFunctionNode"):
+                node_name = node.get_deployment_name()
+            elif node_type_name == "DeploymentMethodNode":
+                node_name = node.get_deployment_method_name()
+            elif node_type_name == "DeploymentExecutorNode":
+                node_name = node._deployment_handle.deployment_name
+            elif node_type_name == "DeploymentMethodExecutorNode":
+                node_name = node._deployment_method_name
+            elif node_type_name == "DeploymentFunctionExecutorNode":
+                node_name = node._deployment_function_handle.deployment_name
+            else:
+                raise ValueError(
+                    "get_node_name() should only be called on DAGNode instances."
+                )
 
-        if node_name not in self.name_to_suffix:
-            self.name_to_suffix[node_name] = 0
+        suffix_counter = self.name_to_suffix.get(node_name)
+        if suffix_counter is None:
+            self.name_to_suffix[node_name] = itertools.count(1)
             return node_name
         else:
-            self.name_to_suffix[node_name] += 1
-            suffix_num = self.name_to_suffix[node_name]
-
-            return f"{node_name}_{suffix_num}"
+            return f"{node_name}_{next(suffix_counter)}"
 
     def reset(self):
         self.name_to_suffix = dict()
@@ -1,12 +1,20 @@
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import TYPE_CHECKING, List, Union, Tuple, Optional
 
 if TYPE_CHECKING:
     import pyarrow
 
+from ray.data.context import DatasetContext
 from ray.data.datasource.file_based_datasource import FileBasedDatasource
 from ray.util.annotations import PublicAPI
 
+# Uncompressed files larger than this are fetched with concurrent ranged reads, on
+# object store filesystems.
+RANGE_READ_MIN_FILE_SIZE = 16 * 1024 * 1024
+RANGE_READ_CHUNK_SIZE = 8 * 1024 * 1024
+RANGE_READ_MAX_CONCURRENCY = 16
+
 
 @PublicAPI
 class BinaryDatasource(FileBasedDatasource):
@@ -23,13 +31,37 @@ class BinaryDatasource(FileBasedDatasource):
 
     _COLUMN_NAME = "bytes"
 
+    def _open_input_source(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        path: str,
+        **open_args,
+    ) -> "pyarrow.NativeFile":
+        # Arrow decodes compressed files as a stream, and open_input_file()
+        # doesn't take any other stream arguments.
+        if not _supports_range_reads(filesystem) or any(
+            arg != "buffer_size" for arg in open_args
+        ):
+            return super()._open_input_source(filesystem, path, **open_args)
+        # Opened for random access, so that _read_file() can fetch large files with
+        # concurrent ranged reads. Snappy compression is only known from the reader
+        # args, so it's handled there.
+        return filesystem.open_input_file(path)
+
     def _read_file(self, f: "pyarrow.NativeFile", path: str, **reader_args):
+        import pyarrow as pa
         from pyarrow.fs import HadoopFileSystem
 
         include_paths = reader_args.pop("include_paths", False)
         if reader_args.get("compression") == "snappy":
             import snappy
 
+            if f.seekable:
+                # Snappy files are decompressed as a stream, so buffer the reads
+                # rather than fetching each compressed block separately.
+                ctx = DatasetContext.get_current()
+                f = pa.input_stream(f, buffer_size=ctx.streaming_read_buffer_size)
+
             filesystem = reader_args.get("filesystem", None)
             rawbytes = BytesIO()
 
@@ -39,6 +71,8 @@ class BinaryDatasource(FileBasedDatasource):
                 snappy.stream_decompress(src=f, dst=rawbytes)
 
             data = rawbytes.getvalue()
+        elif f.seekable and f.size() >= RANGE_READ_MIN_FILE_SIZE:
+            data = _read_ranges_concurrently(f)
         else:
             data = f.readall()
         if include_paths:
@@ -67,3 +101,46 @@ class BinaryDatasource(FileBasedDatasource):
 
     def _rows_per_file(self):
         return 1
+
+
+def _supports_range_reads(filesystem: "pyarrow.fs.FileSystem") -> bool:
+    """Whether the filesystem is an object store that serves concurrent ranged
+    reads of a file efficiently.
+
+    Other filesystems (local, HDFS, fsspec-wrapped such as HTTP) keep reading
+    files as a sequential stream.
+    """
+    from pyarrow import fs
+
+    object_store_filesystems = tuple(
+        getattr(fs, name)
+        for name in ("S3FileSystem", "GcsFileSystem")
+        if hasattr(fs, name)
+    )
+    return isinstance(filesystem, object_store_filesystems)
+
+
+def _read_ranges_concurrently(f: "pyarrow.NativeFile") -> bytearray:
+    """Reads a whole random access file with concurrent ranged reads.
+
+    Since the whole file is read into memory anyway, this avoids paying the
+    per-request latency of a sequential stream (e.g. for S3 GETs). Each range is
+    copied into a single preallocated buffer as soon as it's fetched, so at most
+    RANGE_READ_MAX_CONCURRENCY ranges are held on top of it. The buffer is
+    returned as is, rather than copied into bytes.
+    """
+    size = f.size()
+    data = bytearray(size)
+    offsets = range(0, size, RANGE_READ_CHUNK_SIZE)
+    with memoryview(data) as view:
+
+        def read_range(offset: int):
+            nbytes = min(RANGE_READ_CHUNK_SIZE, size - offset)
+            view[offset : offset + nbytes] = f.read_at(nbytes, offset)
+
+        with ThreadPoolExecutor(
+            max_workers=min(RANGE_READ_MAX_CONCURRENCY, len(offsets))
+        ) as executor:
+            # Consumed to surface any read errors.
+            list(executor.map(read_range, offsets))
+    return data
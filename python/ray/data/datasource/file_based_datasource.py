@@ -1,7 +1,11 @@
+import bisect
+import functools
+import itertools
 import logging
 import pathlib
 import posixpath
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -11,6 +15,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Sequence,
     Tuple,
     Union,
 )
@@ -33,6 +38,7 @@ from ray.data.datasource.partitioning import (
     PathPartitionParser,
 )
 
+import ray.cloudpickle as cloudpickle
 from ray.types import ObjectRef
 from ray.util.annotations import DeveloperAPI, PublicAPI
 from ray._private.utils import _add_creatable_buckets_param_if_s3_uri
@@ -398,8 +404,6 @@ class _FileBasedDatasourceReader(Reader):
         return total_size
 
     def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
-        import numpy as np
-
         open_stream_args = self._open_stream_args
         reader_args = self._reader_args
         partitioning = self._partitioning
@@ -420,6 +424,8 @@ class _FileBasedDatasourceReader(Reader):
             read_paths: List[str],
             fs: Union["pyarrow.fs.FileSystem", _S3FileSystemWrapper],
         ) -> Iterable[Block]:
+            import pyarrow as pa
+
             logger.debug(f"Reading {len(read_paths)} files.")
             if isinstance(fs, _S3FileSystemWrapper):
                 fs = fs.unwrap()
@@ -427,11 +433,12 @@ class _FileBasedDatasourceReader(Reader):
             output_buffer = BlockOutputBuffer(
                 block_udf=_block_udf, target_max_block_size=ctx.target_max_block_size
             )
+            parse = None
+            if partitioning is not None:
+                parse = PathPartitionParser(partitioning)
             for read_path in read_paths:
                 compression = open_stream_args.pop("compression", None)
                 if compression is None:
-                    import pyarrow as pa
-
                     try:
                         # If no compression manually given, try to detect
                         # compression codec from path.
@@ -439,8 +446,6 @@ class _FileBasedDatasourceReader(Reader):
                     except (ValueError, TypeError):
                         # Arrow's compression inference on the file path
                         # doesn't work for Snappy, so we double-check ourselves.
-                        import pathlib
-
                         suffix = pathlib.Path(read_path).suffix
                         if suffix and suffix[1:] == "snappy":
                             compression = "snappy"
@@ -458,8 +463,7 @@ class _FileBasedDatasourceReader(Reader):
                     open_stream_args["compression"] = compression
 
                 partitions: Dict[str, str] = {}
-                if partitioning is not None:
-                    parse = PathPartitionParser(partitioning)
+                if parse is not None:
                     partitions = parse(read_path)
 
                 with open_input_source(fs, read_path, **open_stream_args) as f:
@@ -475,12 +479,16 @@ class _FileBasedDatasourceReader(Reader):
             if output_buffer.has_next():
                 yield output_buffer.next()
 
+        # The read_files closure is the same for every read task, so serialize it
+        # once here rather than once per read task.
+        read_files = _SerializedReadFn(read_files)
+
         # fix https://github.com/ray-project/ray/issues/24296
         parallelism = min(parallelism, len(paths))
 
         read_tasks = []
         for read_paths, file_sizes in zip(
-            np.array_split(paths, parallelism), np.array_split(file_sizes, parallelism)
+            *_split_by_size(paths, file_sizes, parallelism)
         ):
             if len(read_paths) <= 0:
                 continue
@@ -492,13 +500,85 @@ class _FileBasedDatasourceReader(Reader):
                 file_sizes=file_sizes,
             )
             read_task = ReadTask(
-                lambda read_paths=read_paths: read_files(read_paths, filesystem), meta
+                functools.partial(read_files, read_paths, filesystem), meta
             )
             read_tasks.append(read_task)
 
         return read_tasks
 
 
+class _SerializedReadFn:
+    """Wraps a read function along with its pickled form, so that the function (and
+    everything its closure captures) is only serialized once, however many read
+    tasks it's shared by.
+    """
+
+    def __init__(self, read_fn: Callable[..., Iterable[Block]]):
+        self._data = cloudpickle.dumps(read_fn)
+        self._read_fn = read_fn
+
+    def __call__(self, *args, **kwargs) -> Iterable[Block]:
+        if self._read_fn is None:
+            self._read_fn = cloudpickle.loads(self._data)
+        return self._read_fn(*args, **kwargs)
+
+    def __getstate__(self) -> bytes:
+        return self._data
+
+    def __setstate__(self, data: bytes):
+        # Deserialized lazily on first call.
+        self._data = data
+        self._read_fn = None
+
+
+def _split_evenly(items: Sequence[Any], num_splits: int) -> List[Sequence[Any]]:
+    """Splits the items into num_splits contiguous slices whose lengths differ by at
+    most one, like np.array_split but without copying the items into an array.
+    """
+    split_size, remainder = divmod(len(items), num_splits)
+    splits = []
+    start = 0
+    for i in range(num_splits):
+        end = start + split_size + (1 if i < remainder else 0)
+        splits.append(items[start:end])
+        start = end
+    return splits
+
+
+def _split_by_size(
+    paths: List[str], file_sizes: List[Optional[int]], num_splits: int
+) -> Tuple[List[List[str]], List[List[Optional[int]]]]:
+    """Splits the paths and their file sizes into num_splits contiguous, non-empty
+    groups of roughly equal total size, so that skewed file sizes don't result in
+    straggling read tasks.
+
+    Groups are contiguous to preserve the order of the paths. Falls back to groups of
+    equal length if any file size is unknown.
+    """
+    if num_splits <= 1 or None in file_sizes or sum(file_sizes) == 0:
+        return _split_evenly(paths, num_splits), _split_evenly(file_sizes, num_splits)
+
+    # cumulative_sizes[i] holds the total size of paths[:i].
+    cumulative_sizes = [0] + list(itertools.accumulate(file_sizes))
+    target_size = cumulative_sizes[-1] / num_splits
+    num_paths = len(paths)
+    bounds = [0]
+    for i in range(1, num_splits):
+        target = i * target_size
+        end = bisect.bisect_left(cumulative_sizes, target)
+        if target - cumulative_sizes[end - 1] < cumulative_sizes[end] - target:
+            end -= 1
+        # Leave at least one path for this group and for each of the remaining ones.
+        end = max(bounds[-1] + 1, min(end, num_paths - (num_splits - i)))
+        bounds.append(end)
+    bounds.append(num_paths)
+    splits = list(zip(bounds[:-1], bounds[1:]))
+    return (
+        [paths[start:end] for start, end in splits],
+        [file_sizes[start:end] for start, end in splits],
+    )
+
+
 def _add_partitions(
     data: Union["pyarrow.Table", "pd.DataFrame"], partitions: Dict[str, Any]
 ) -> Union["pyarrow.Table", "pd.DataFrame"]:
@@ -635,14 +715,19 @@ def _resolve_paths_and_filesystem(
     resolved_paths = []
     for path in paths:
         path = _resolve_custom_scheme(path)
+        if filesystem is not None:
+            # The filesystem is already known (either provided or inferred from the
+            # first path), so only the path needs to be unwrapped and normalized.
+            if need_unwrap_path_protocol:
+                path = _unwrap_protocol(path)
+            resolved_paths.append(filesystem.normalize_path(path))
+            continue
         try:
-            resolved_filesystem, resolved_path = _resolve_filesystem_and_path(
-                path, filesystem
-            )
+            resolved_filesystem, resolved_path = _resolve_filesystem_and_path(path)
         except pa.lib.ArrowInvalid as e:
             if "Cannot parse URI" in str(e):
                 resolved_filesystem, resolved_path = _resolve_filesystem_and_path(
-                    _encode_url(path), filesystem
+                    _encode_url(path)
                 )
                 resolved_path = _decode_url(resolved_path)
             elif "Unrecognized filesystem type in URI" in str(e):
@@ -665,10 +750,7 @@ def _resolve_paths_and_filesystem(
                     raise
             else:
                 raise
-        if filesystem is None:
-            filesystem = resolved_filesystem
-        elif need_unwrap_path_protocol:
-            resolved_path = _unwrap_protocol(resolved_path)
+        filesystem = resolved_filesystem
         resolved_path = filesystem.normalize_path(resolved_path)
         resolved_paths.append(resolved_path)
 
@@ -697,20 +779,47 @@ def _expand_directory(
     if exclude_prefixes is None:
         exclude_prefixes = [".", "_"]
 
-    from pyarrow.fs import FileSelector
+    from pyarrow.fs import FileSelector, FileType
 
-    selector = FileSelector(path, recursive=True)
-    files = filesystem.get_file_info(selector)
+    def is_excluded(file_path: str) -> bool:
+        if not file_path.startswith(base_path):
+            return True
+        relative = file_path[len(base_path) :]
+        return any(relative.startswith(prefix) for prefix in exclude_prefixes)
+
+    # List the top level non-recursively, then walk each subdirectory concurrently,
+    # since a single recursive listing serializes one metadata request per level
+    # (which dominates read latency on cloud storage).
+    selector = FileSelector(path, recursive=False)
     base_path = selector.base_dir
+    files = []
+    subdirs = []
+    for file_ in filesystem.get_file_info(selector):
+        if file_.type == FileType.Directory:
+            # Everything under an excluded subdirectory shares its excluded prefix,
+            # so there's no need to list it.
+            if not is_excluded(file_.path):
+                subdirs.append(file_.path)
+        else:
+            files.append(file_)
+    if len(subdirs) == 1:
+        files.extend(filesystem.get_file_info(FileSelector(subdirs[0], recursive=True)))
+    elif subdirs:
+        with ThreadPoolExecutor(max_workers=min(64, len(subdirs))) as executor:
+            for subdir_files in executor.map(
+                lambda subdir: filesystem.get_file_info(
+                    FileSelector(subdir, recursive=True)
+                ),
+                subdirs,
+            ):
+                files.extend(subdir_files)
+
     filtered_paths = []
     for file_ in files:
         if not file_.is_file:
             continue
         file_path = file_.path
-        if not file_path.startswith(base_path):
-            continue
-        relative = file_path[len(base_path) :]
-        if any(relative.startswith(prefix) for prefix in exclude_prefixes):
+        if is_excluded(file_path):
             continue
         filtered_paths.append((file_path, file_))
     # We sort the paths to guarantee a stable order.
@@ -165,17 +165,26 @@ class DefaultFileMetadataProvider(BaseFileMetadataProvider):
                 f"all point to files and never directories, try rerunning this read "
                 f"with `meta_provider=FastFileMetadataProvider()`."
             )
+        try:
+            # Fetch the info of all paths in one call, so that the filesystem can
+            # issue the requests concurrently.
+            path_infos = filesystem.get_file_info(paths)
+        except OSError as e:
+            # The batched call doesn't say which path failed, so retry them one by
+            # one to report the culprit.
+            for path in paths:
+                try:
+                    filesystem.get_file_info(path)
+                except OSError as path_error:
+                    _handle_read_os_error(path_error, path)
+            _handle_read_os_error(e, paths)
         expanded_paths = []
         file_infos = []
-        for path in paths:
-            try:
-                file_info = filesystem.get_file_info(path)
-            except OSError as e:
-                _handle_read_os_error(e, path)
+        for path, file_info in zip(paths, path_infos):
             if file_info.type == FileType.Directory:
-                paths, file_infos_ = _expand_directory(path, filesystem)
-                expanded_paths.extend(paths)
-                file_infos.extend(file_infos_)
+                dir_paths, dir_file_infos = _expand_directory(path, filesystem)
+                expanded_paths.extend(dir_paths)
+                file_infos.extend(dir_file_infos)
             elif file_info.type == FileType.File:
                 expanded_paths.append(path)
                 file_infos.append(file_info)
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, List, Optional
 
-from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.arrow_block import ArrowBlockBuilder
 from ray.data.datasource.binary_datasource import BinaryDatasource
 from ray.util.annotations import PublicAPI
 
@@ -22,18 +22,18 @@ class TextDatasource(BinaryDatasource):
         assert len(block) == 1
         data = block[0]
 
-        builder = DelegatingBlockBuilder()
-
         drop_empty_lines = reader_args["drop_empty_lines"]
         lines = data.decode(reader_args["encoding"]).split("\n")
-        for line in lines:
-            if drop_empty_lines and line.strip() == "":
-                continue
-            item = {self._COLUMN_NAME: line}
-            builder.add(item)
+        if drop_empty_lines:
+            lines = [line for line in lines if line.strip() != ""]
+        if not lines:
+            return ArrowBlockBuilder().build()
 
-        block = builder.build()
-        return block
+        import pyarrow as pa
+
+        # Build the column in a single call, rather than adding each line to a block
+        # builder as a separate row.
+        return pa.table({self._COLUMN_NAME: lines})
 
     def _convert_block_to_tabular_block(
         self,
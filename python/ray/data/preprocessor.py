@@ -1,6 +1,7 @@
 import abc
 import warnings
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional, Union, Dict, Any
 
 from ray.air.util.data_batch_conversion import BatchFormat, BlockFormat
@@ -58,6 +59,8 @@ class Preprocessor(abc.ABC):
 
     # Preprocessors that do not need to be fitted must override this.
     _is_fittable = True
+    # Set by fit() once the preprocessor has been fitted.
+    _fitted = False
 
     def fit_status(self) -> "Preprocessor.FitStatus":
         if not self._is_fittable:
@@ -71,6 +74,9 @@ class Preprocessor(abc.ABC):
         """Return Dataset stats for the most recent transform call, if any."""
         if not hasattr(self, "_transform_stats"):
             return None
+        if not isinstance(self._transform_stats, str):
+            # Summarized lazily on first access.
+            self._transform_stats = self._transform_stats.summary_string()
         return self._transform_stats
 
     def fit(self, dataset: Dataset) -> "Preprocessor":
@@ -102,7 +108,9 @@ class Preprocessor(abc.ABC):
                 "All previously fitted state will be overwritten!"
             )
 
-        return self._fit(dataset)
+        fitted_preprocessor = self._fit(dataset)
+        self._fitted = True
+        return fitted_preprocessor
 
     def fit_transform(self, dataset: Dataset) -> Dataset:
         """Fit this Preprocessor to the Dataset and then transform the Dataset.
@@ -142,7 +150,9 @@ class Preprocessor(abc.ABC):
                 "or simply use fit_transform() to run both steps"
             )
         transformed_ds = self._transform(dataset)
-        self._transform_stats = transformed_ds.stats()
+        # Only the DatasetStats are kept, since they don't reference the Dataset's
+        # blocks.
+        self._transform_stats = transformed_ds._plan.stats()
         return transformed_ds
 
     def transform_batch(self, data: "DataBatchType") -> "DataBatchType":
@@ -170,12 +180,24 @@ class Preprocessor(abc.ABC):
             )
         return self._transform_batch(data)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # Serialize the stats summary rather than the DatasetStats, so the stats
+        # don't depend on the cluster they were collected on.
+        transform_stats = state.get("_transform_stats")
+        if transform_stats is not None and not isinstance(transform_stats, str):
+            state["_transform_stats"] = transform_stats.summary_string()
+        return state
+
     def _check_is_fitted(self) -> bool:
         """Returns whether this preprocessor is fitted.
 
-        We use the convention that attributes with a trailing ``_`` are set after
-        fitting is complete.
+        Preprocessors fitted with ``fit`` are flagged as such. Otherwise (e.g. for
+        preprocessors pickled before the flag was introduced), we use the convention
+        that attributes with a trailing ``_`` are set after fitting is complete.
         """
+        if self._fitted:
+            return True
         fitted_vars = [v for v in vars(self) if v.endswith("_")]
         return bool(fitted_vars)
 
@@ -192,19 +214,23 @@ class Preprocessor(abc.ABC):
             * ``arrow`` and ``numpy`` data format prioritizes ``numpy`` transform if available. # noqa: E501
             * Fall back to what's available if no preferred path found.
         """
-
+        return self._determine_transform_to_use_for_class(data_format)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _determine_transform_to_use_for_class(
+        cls, data_format: BlockFormat
+    ) -> BatchFormat:
+        # This only depends on which transforms the class implements, so it's
+        # computed once per class and data format rather than once per batch.
         assert data_format in (
             "pandas",
             "arrow",
             "numpy",
         ), f"Unsupported data format: {data_format}"
 
-        has_transform_pandas = (
-            self.__class__._transform_pandas != Preprocessor._transform_pandas
-        )
-        has_transform_numpy = (
-            self.__class__._transform_numpy != Preprocessor._transform_numpy
-        )
+        has_transform_pandas = cls._transform_pandas != Preprocessor._transform_pandas
+        has_transform_numpy = cls._transform_numpy != Preprocessor._transform_numpy
 
         # Infer transform type by prioritizing native transformation to minimize
         # data conversion cost.
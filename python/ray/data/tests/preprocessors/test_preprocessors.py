@@ -1,5 +1,7 @@
+import gc
 import re
 import warnings
+import weakref
 from typing import Dict, Union
 from unittest.mock import patch
 
@@ -128,6 +130,52 @@ def test_fit_twice(mocked_warn):
     mocked_warn.assert_called_once_with(msg)
 
 
+def test_fit_status():
+    class DummyPreprocessor(Preprocessor):
+        def _fit(self, dataset):
+            # No fitted attributes with a trailing underscore are set.
+            return self
+
+        def _transform_pandas(self, df: "pd.DataFrame") -> "pd.DataFrame":
+            return df
+
+    preprocessor = DummyPreprocessor()
+    assert preprocessor.fit_status() == Preprocessor.FitStatus.NOT_FITTED
+    preprocessor.fit(ray.data.range_table(1))
+    assert preprocessor.fit_status() == Preprocessor.FitStatus.FITTED
+
+    # Preprocessors with fitted attributes set outside of fit() are still fitted.
+    preprocessor = DummyPreprocessor()
+    preprocessor.stats_ = {}
+    assert preprocessor.fit_status() == Preprocessor.FitStatus.FITTED
+
+
+def test_transform_stats_after_dataset_is_deleted():
+    """Tests that transform stats outlive the transformed Dataset."""
+    preprocessor = BatchMapper(fn=lambda x: x, batch_format="pandas")
+    assert preprocessor.transform_stats() is None
+
+    transformed_ds = preprocessor.transform(ray.data.range_table(10))
+    transformed_ds_ref = weakref.ref(transformed_ds)
+    del transformed_ds
+    gc.collect()
+
+    # The preprocessor doesn't keep the Dataset (and its blocks) alive.
+    assert transformed_ds_ref() is None
+    assert preprocessor.transform_stats() is not None
+
+
+def test_chain_transform_stats():
+    chain = Chain(
+        BatchMapper(fn=lambda x: x, batch_format="pandas"),
+        BatchMapper(fn=lambda x: x, batch_format="pandas"),
+    )
+    chain.transform(ray.data.range_table(10))
+
+    assert chain.transform_stats() is not None
+    assert chain.transform_stats() == chain.preprocessors[-1].transform_stats()
+
+
 def test_numpy_pandas_support_simple_dataset(create_dummy_preprocessors):
     # Case 1: simple dataset. No support
     (
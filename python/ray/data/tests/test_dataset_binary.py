@@ -6,6 +6,7 @@ import pandas as pd
 import pyarrow as pa
 import pytest
 import snappy
+from pytest_lazyfixture import lazy_fixture
 
 import ray
 from ray.data.tests.util import Counter
@@ -18,6 +19,7 @@ from ray.data.datasource import (
     PathPartitionFilter,
     Partitioning,
 )
+from ray.data.datasource.file_based_datasource import _unwrap_protocol
 
 from ray.data.tests.conftest import *  # noqa
 from ray.data.tests.mock_http_server import *  # noqa
@@ -53,6 +55,31 @@ def test_read_binary_files(ray_start_regular_shared):
         assert "bytes" in str(ds), ds
 
 
+@pytest.mark.parametrize(
+    "fs,data_path",
+    [
+        (None, lazy_fixture("local_path")),
+        (lazy_fixture("s3_fs"), lazy_fixture("s3_path")),
+    ],
+)
+def test_read_binary_files_large(ray_start_regular_shared, fs, data_path):
+    from ray.data.datasource import binary_datasource
+
+    # Large enough to be fetched with several concurrent ranged reads from S3, with
+    # a partial trailing range. Other filesystems read it as a stream.
+    data = os.urandom(2 * binary_datasource.RANGE_READ_MIN_FILE_SIZE + 1)
+    path = os.path.join(data_path, "large.bin")
+    if fs is None:
+        with open(path, "wb") as f:
+            f.write(data)
+    else:
+        with fs.open_output_stream(_unwrap_protocol(path)) as f:
+            f.write(data)
+
+    ds = ray.data.read_binary_files(path, filesystem=fs)
+    assert ds.take() == [data]
+
+
 def test_read_binary_files_with_fs(ray_start_regular_shared):
     with gen_bin_files(10) as (tempdir, paths):
         # All the paths are absolute, so we want the root file system.
@@ -109,6 +136,18 @@ def test_read_binary_snappy_inferred(ray_start_regular_shared, tmp_path):
     assert sorted(ds.take()) == [byte_str]
 
 
+def test_read_binary_snappy_large(ray_start_regular_shared, tmp_path):
+    from ray.data.datasource import binary_datasource
+
+    # Large enough for an uncompressed file to be fetched with ranged reads.
+    byte_str = os.urandom(2 * binary_datasource.RANGE_READ_MIN_FILE_SIZE)
+    path = os.path.join(tmp_path, "large.snappy")
+    with open(path, "wb") as f:
+        snappy.stream_compress(BytesIO(byte_str), f)
+    ds = ray.data.read_binary_files(path)
+    assert ds.take() == [byte_str]
+
+
 def test_read_binary_meta_provider(
     ray_start_regular_shared,
     tmp_path,
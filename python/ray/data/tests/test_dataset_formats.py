@@ -6,6 +6,7 @@ import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
 import torchvision
+from ray.data.datasource.file_based_datasource import _split_by_size
 from ray.data.datasource.file_meta_provider import _handle_read_os_error
 
 from fsspec.implementations.local import LocalFileSystem
@@ -328,6 +329,29 @@ def test_read_s3_file_error(ray_start_regular_shared, s3_path):
         _handle_read_os_error(error, dummy_path)
 
 
+def test_split_by_size():
+    paths = ["a", "b", "c", "d", "e"]
+    # A single large file gets its own read task.
+    assert _split_by_size(paths, [100, 1, 1, 1, 1], 2) == (
+        [["a"], ["b", "c", "d", "e"]],
+        [[100], [1, 1, 1, 1]],
+    )
+    assert _split_by_size(paths, [1, 1, 1, 1, 100], 3) == (
+        [["a", "b", "c"], ["d"], ["e"]],
+        [[1, 1, 1], [1], [100]],
+    )
+    # Every split gets at least one file.
+    assert _split_by_size(paths, [0, 0, 0, 0, 5], 5) == (
+        [["a"], ["b"], ["c"], ["d"], ["e"]],
+        [[0], [0], [0], [0], [5]],
+    )
+    # Unknown file sizes fall back to splitting by the number of files.
+    assert _split_by_size(paths, [None, 1, 1, 1, 100], 2) == (
+        [["a", "b", "c"], ["d", "e"]],
+        [[None, 1, 1], [1, 100]],
+    )
+
+
 if __name__ == "__main__":
     import sys
 
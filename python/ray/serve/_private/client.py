@@ -381,9 +381,11 @@ class ServeControllerClient:
             if cached_handle.is_polling and cached_handle.is_same_loop:
                 return cached_handle
 
-        all_endpoints = ray.get(self._controller.get_all_endpoints.remote())
-        if not missing_ok and deployment_name not in all_endpoints:
-            raise KeyError(f"Deployment '{deployment_name}' does not exist.")
+        # Only ask the controller for the endpoints when they are checked.
+        if not missing_ok:
+            all_endpoints = ray.get(self._controller.get_all_endpoints.remote())
+            if deployment_name not in all_endpoints:
+                raise KeyError(f"Deployment '{deployment_name}' does not exist.")
 
         if sync:
             handle = RayServeSyncHandle(
@@ -266,13 +266,15 @@ class ReplicaName:
         assert ReplicaName.is_replica_name(actor_name)
         # TODO(simon): this currently conforms the tag and suffix logic. We
         # can try to keep the internal name always hard coded with the prefix.
-        replica_name = actor_name.replace(cls.prefix, "")
-        parsed = replica_name.split(cls.delimiter)
-        assert len(parsed) == 2, (
+        replica_name = actor_name[len(cls.prefix) :]
+        deployment_tag, delimiter, replica_suffix = replica_name.partition(
+            cls.delimiter
+        )
+        assert delimiter and cls.delimiter not in replica_suffix, (
             f"Given replica name {replica_name} didn't match pattern, please "
             f"ensure it has exactly two fields with delimiter {cls.delimiter}"
         )
-        return cls(deployment_tag=parsed[0], replica_suffix=parsed[1])
+        return cls(deployment_tag=deployment_tag, replica_suffix=replica_suffix)
 
     def __str__(self):
         return self.replica_tag
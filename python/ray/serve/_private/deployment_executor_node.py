@@ -23,6 +23,8 @@ class DeploymentExecutorNode(DAGNode):
     deployment.
     """
 
+    __slots__ = ("_deployment_handle",)
+
     def __init__(
         self,
         deployment_handle,
@@ -53,6 +55,14 @@ class DeploymentExecutorNode(DAGNode):
         return self._deployment_handle
 
     def __getattr__(self, method_name: str):
+        # Reading an unset slot falls back to __getattr__, and must not be mistaken
+        # for a deployment method.
+        if any(
+            method_name in getattr(cls, "__slots__", ()) for cls in type(self).__mro__
+        ):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{method_name}'"
+            )
         return DeploymentMethodExecutorNode(
             method_name,
             (),
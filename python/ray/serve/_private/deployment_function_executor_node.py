@@ -21,6 +21,8 @@ class DeploymentFunctionExecutorNode(DAGNode):
     deployment.
     """
 
+    __slots__ = ("_deployment_function_handle",)
+
     def __init__(
         self,
         deployment_function_handle: Union[RayServeSyncHandle, RayServeHandle],
@@ -80,6 +80,24 @@ class DeploymentFunctionNode(DAGNode):
         new_options: Dict[str, Any],
         new_other_args_to_resolve: Dict[str, Any],
     ):
+        schema = self._bound_other_args_to_resolve.get("deployment_schema")
+        new_schema = new_other_args_to_resolve.get("deployment_schema")
+        if new_options is self._bound_options and new_schema is schema:
+            # The deployment is built from the options and the schema only, so
+            # when those are unchanged it's reused instead of rebuilt.
+            node = DeploymentFunctionNode.__new__(DeploymentFunctionNode)
+            node._body = self._body
+            node._deployment_name = self._deployment_name
+            DAGNode.__init__(
+                node,
+                new_args,
+                new_kwargs,
+                new_options,
+                other_args_to_resolve=new_other_args_to_resolve,
+            )
+            node._deployment = self._deployment
+            node._deployment_handle = self._deployment_handle
+            return node
         return DeploymentFunctionNode(
             self._body,
             self._deployment_name,
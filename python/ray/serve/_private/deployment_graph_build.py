@@ -16,7 +16,6 @@ from ray.serve._private.deployment_function_executor_node import (
     DeploymentFunctionExecutorNode,
 )
 from ray.serve._private.json_serde import DAGNodeEncoder
-from ray.serve.handle import RayServeDeploymentHandle
 from ray.serve.schema import DeploymentSchema
 
 
@@ -84,11 +83,18 @@ def build(ray_dag_root_node: DAGNode) -> List[Deployment]:
         >>> deployments = build_app(ray_dag) # it can be method node
         >>> deployments = build_app(m1) # or just a regular node.
     """
+    deployments_by_name = OrderedDict()
+
+    def transform_and_extract(node):
+        # Extract deployments in the same walk as the transformation, which
+        # visits nodes in the order extract_deployments_from_serve_dag() would.
+        serve_node = transform_ray_dag_to_serve_dag(node, node_name_generator)
+        _add_deployment_of_node(deployments_by_name, serve_node)
+        return serve_node
+
     with _DAGNodeNameGenerator() as node_name_generator:
-        serve_root_dag = ray_dag_root_node.apply_recursive(
-            lambda node: transform_ray_dag_to_serve_dag(node, node_name_generator)
-        )
-    deployments = extract_deployments_from_serve_dag(serve_root_dag)
+        serve_root_dag = ray_dag_root_node.apply_recursive(transform_and_extract)
+    deployments = list(deployments_by_name.values())
 
     # After Ray DAG is transformed to Serve DAG with deployments and their init
     # args filled, generate a minimal weight executor serve dag for perf
@@ -141,6 +147,8 @@ def transform_ray_dag_to_serve_dag(
     """
     if isinstance(dag_node, ClassNode):
         deployment_name = node_name_generator.get_node_name(dag_node)
+        init_args = dag_node.get_args()
+        init_kwargs = dag_node.get_kwargs()
 
         # Deployment can be passed into other DAGNodes as init args. This is
         # supported pattern in ray DAG that user can instantiate and pass class
@@ -154,7 +162,8 @@ def transform_ray_dag_to_serve_dag(
         # serve DAG end to end executable.
         def replace_with_handle(node):
             if isinstance(node, DeploymentNode):
-                return RayServeDeploymentHandle(node._deployment.name)
+                # Reuse the handle the node already created for its deployment.
+                return node._deployment_handle
             elif isinstance(node, DeploymentExecutorNode):
                 return node._deployment_handle
 
@@ -162,7 +171,7 @@ def transform_ray_dag_to_serve_dag(
             replaced_deployment_init_args,
             replaced_deployment_init_kwargs,
         ) = dag_node.apply_functional(
-            [dag_node.get_args(), dag_node.get_kwargs()],
+            [init_args, init_kwargs],
             predictate_fn=lambda node: isinstance(
                 node,
                 # We need to match and replace all DAGNodes even though they
@@ -217,8 +226,8 @@ def transform_ray_dag_to_serve_dag(
 
         return DeploymentNode(
             deployment,
-            dag_node.get_args(),
-            dag_node.get_kwargs(),
+            init_args,
+            init_kwargs,
             dag_node.get_options(),
             other_args_to_resolve=dag_node.get_other_args_to_resolve(),
         )
@@ -286,10 +295,7 @@ def extract_deployments_from_serve_dag(
     deployments = OrderedDict()
 
     def extractor(dag_node):
-        if isinstance(dag_node, (DeploymentNode, DeploymentFunctionNode)):
-            deployment = dag_node._deployment
-            # In case same deployment is used in multiple DAGNodes
-            deployments[deployment.name] = deployment
+        _add_deployment_of_node(deployments, dag_node)
         return dag_node
 
     serve_dag_root.apply_recursive(extractor)
@@ -297,6 +303,15 @@ def extract_deployments_from_serve_dag(
     return list(deployments.values())
 
 
+def _add_deployment_of_node(
+    deployments: "OrderedDict[str, Deployment]", dag_node: DAGNode
+):
+    if isinstance(dag_node, (DeploymentNode, DeploymentFunctionNode)):
+        deployment = dag_node._deployment
+        # In case same deployment is used in multiple DAGNodes
+        deployments[deployment.name] = deployment
+
+
 def transform_serve_dag_to_serve_executor_dag(serve_dag_root_node: DAGNode):
     """Given a runnable serve dag with deployment init args and options
     processed, transform into an equivalent, but minimal dag optimized for
@@ -354,7 +369,11 @@ def generate_executor_dag_driver_deployment(
                 DeploymentFunctionExecutorNode,
             ),
         ):
-            serve_dag_root_json = json.dumps(node, cls=DAGNodeEncoder)
+            # The JSON is shipped with the handle to every replica, so drop the
+            # default whitespace between items.
+            serve_dag_root_json = json.dumps(
+                node, cls=DAGNodeEncoder, separators=(",", ":")
+            )
             return RayServeDAGHandle(serve_dag_root_json)
 
     (
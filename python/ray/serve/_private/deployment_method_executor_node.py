@@ -20,6 +20,12 @@ class DeploymentMethodExecutorNode(DAGNode):
     deployment.
     """
 
+    __slots__ = (
+        "_deployment_node_replaced_by_handle",
+        "_deployment_method_name",
+        "_method_remote_cache",
+    )
+
     def __init__(
         self,
         deployment_method_name: str,
@@ -34,6 +40,9 @@ class DeploymentMethodExecutorNode(DAGNode):
             PARENT_CLASS_NODE_KEY
         ]
         self._deployment_method_name = deployment_method_name
+        # [handle, bound ``remote`` of its method], resolved on first
+        # execution and shared with the copies made for each request.
+        self._method_remote_cache = [None, None]
 
     def _copy_impl(
         self,
@@ -42,12 +51,22 @@ class DeploymentMethodExecutorNode(DAGNode):
         new_options: Dict[str, Any],
         new_other_args_to_resolve: Dict[str, Any],
     ) -> "DeploymentMethodExecutorNode":
-        return DeploymentMethodExecutorNode(
+        node = DeploymentMethodExecutorNode(
             self._deployment_method_name,
             new_args,
             new_kwargs,
             other_args_to_resolve=new_other_args_to_resolve,
         )
+        node._method_remote_cache = self._method_remote_cache
+        return node
+
+    def _get_method_remote(self):
+        cache = self._method_remote_cache
+        handle = self._deployment_node_replaced_by_handle
+        if cache[0] is not handle:
+            cache[1] = getattr(handle, self._deployment_method_name).remote
+            cache[0] = handle
+        return cache[1]
 
     def _execute_impl(self, *args, **kwargs) -> ObjectRef:
         """Executor of DeploymentNode getting called each time on dag.execute.
@@ -56,10 +75,7 @@ class DeploymentMethodExecutorNode(DAGNode):
         receive whatever this method returns. We return a handle here so method
         node can directly call upon.
         """
-        method_body = getattr(
-            self._deployment_node_replaced_by_handle, self._deployment_method_name
-        )
-        return method_body.remote(*self._bound_args, **self._bound_kwargs)
+        return self._get_method_remote()(*self._bound_args, **self._bound_kwargs)
 
     def __str__(self) -> str:
         return get_dag_node_str(self, str(self._deployment_method_name))
@@ -39,13 +39,19 @@ class DeploymentNode(DAGNode):
         new_options: Dict[str, Any],
         new_other_args_to_resolve: Dict[str, Any],
     ):
-        return DeploymentNode(
-            self._deployment,
+        # Bypass __init__ so that copies share the deployment handle, which
+        # only depends on the deployment, instead of creating a new one.
+        node = DeploymentNode.__new__(DeploymentNode)
+        DAGNode.__init__(
+            node,
             new_args,
             new_kwargs,
             new_options,
             other_args_to_resolve=new_other_args_to_resolve,
         )
+        node._deployment = self._deployment
+        node._deployment_handle = self._deployment_handle
+        return node
 
     def __getattr__(self, method_name: str):
         # Raise an error if the method is invalid.
@@ -17,6 +17,14 @@ from ray.serve._private.constants import SERVE_LOGGER_NAME
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
+# Content-type header values for the content types accepted by
+# Response.set_content_type().
+_CONTENT_TYPE_HEADERS = {
+    "text": b"text/plain",
+    "text-utf8": b"text/plain; charset=utf-8",
+    "json": b"application/json",
+}
+
 
 @dataclass
 class HTTPRequestWrapper:
@@ -91,14 +99,10 @@ class Response:
             self.set_content_type("json")
 
     def set_content_type(self, content_type):
-        if content_type == "text":
-            self.raw_headers.append([b"content-type", b"text/plain"])
-        elif content_type == "text-utf8":
-            self.raw_headers.append([b"content-type", b"text/plain; charset=utf-8"])
-        elif content_type == "json":
-            self.raw_headers.append([b"content-type", b"application/json"])
-        else:
+        header_value = _CONTENT_TYPE_HEADERS.get(content_type)
+        if header_value is None:
             raise ValueError("Invalid content type {}".format(content_type))
+        self.raw_headers.append([b"content-type", header_value])
 
     async def send(self, scope, receive, send):
         await send(
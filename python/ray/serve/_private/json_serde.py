@@ -114,6 +114,19 @@ class DAGNodeEncoder(json.JSONEncoder):
             return json.JSONEncoder.default(self, obj)
 
 
+# DAGNode types that can be re-constructed without importing user code. This is
+# consulted for every JSON object decoded, so it's built once at import time.
+_NODE_TYPE_TO_CLS = {
+    # Ray DAG Inputs
+    InputNode.__name__: InputNode,
+    InputAttributeNode.__name__: InputAttributeNode,
+    # Deployment graph execution nodes
+    DeploymentExecutorNode.__name__: DeploymentExecutorNode,
+    DeploymentMethodExecutorNode.__name__: DeploymentMethodExecutorNode,
+    DeploymentFunctionExecutorNode.__name__: DeploymentFunctionExecutorNode,
+}
+
+
 def dagnode_from_json(input_json: Any) -> Union[DAGNode, RayServeHandle, Any]:
     """
     Decode a DAGNode from given input json dictionary. JSON serialization is
@@ -132,38 +145,31 @@ def dagnode_from_json(input_json: Any) -> Union[DAGNode, RayServeHandle, Any]:
                 that we perserve the same parent node.
         - .options() does not contain any DAGNode type
     """
-    node_type_to_cls = {
-        # Ray DAG Inputs
-        InputNode.__name__: InputNode,
-        InputAttributeNode.__name__: InputAttributeNode,
-        # Deployment graph execution nodes
-        DeploymentExecutorNode.__name__: DeploymentExecutorNode,
-        DeploymentMethodExecutorNode.__name__: DeploymentMethodExecutorNode,
-        DeploymentFunctionExecutorNode.__name__: DeploymentFunctionExecutorNode,
-    }
     # Deserialize RayServeHandle type
     if SERVE_HANDLE_JSON_KEY in input_json:
         return _serve_handle_from_json_dict(input_json)
+    node_type = input_json.get(DAGNODE_TYPE_KEY)
     # Base case for plain objects
-    elif DAGNODE_TYPE_KEY not in input_json:
+    if node_type is None:
         return input_json
-    elif input_json[DAGNODE_TYPE_KEY] == RayServeDAGHandle.__name__:
+    # Deserialize DAGNode type
+    node_cls = _NODE_TYPE_TO_CLS.get(node_type)
+    if node_cls is not None:
+        return node_cls.from_json(input_json)
+    elif node_type == RayServeDAGHandle.__name__:
         return RayServeDAGHandle(input_json["dag_node_json"])
-    elif input_json[DAGNODE_TYPE_KEY] == "DeploymentSchema":
+    elif node_type == "DeploymentSchema":
         return DeploymentSchema.parse_obj(input_json["schema"])
-    elif input_json[DAGNODE_TYPE_KEY] == RayServeDeploymentHandle.__name__:
+    elif node_type == RayServeDeploymentHandle.__name__:
         return RayServeDeploymentHandle(
             input_json["deployment_name"],
             HandleOptions(input_json["handle_options_method_name"]),
         )
-    # Deserialize DAGNode type
-    elif input_json[DAGNODE_TYPE_KEY] in node_type_to_cls:
-        return node_type_to_cls[input_json[DAGNODE_TYPE_KEY]].from_json(input_json)
     else:
         # Class and Function nodes require original module as body.
         module_name, attr_name = parse_import_path(input_json["import_path"])
         module = getattr(import_module(module_name), attr_name)
-        if input_json[DAGNODE_TYPE_KEY] == FunctionNode.__name__:
+        if node_type == FunctionNode.__name__:
             return FunctionNode.from_json(input_json, module)
-        elif input_json[DAGNODE_TYPE_KEY] == ClassNode.__name__:
+        elif node_type == ClassNode.__name__:
             return ClassNode.from_json(input_json, module)
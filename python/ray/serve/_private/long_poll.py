@@ -249,7 +249,8 @@ class LongPollHost:
             timeout=random.uniform(*LISTEN_FOR_CHANGE_REQUEST_TIMEOUT_S),
         )
 
-        [task.cancel() for task in not_done]
+        for task in not_done:
+            task.cancel()
 
         if len(done) == 0:
             return LongPollState.TIME_OUT
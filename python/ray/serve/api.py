@@ -28,7 +28,11 @@ from ray.serve.context import (
     _set_global_client,
 )
 from ray.serve.deployment import Deployment
-from ray.serve.deployment_graph import ClassNode, FunctionNode
+from ray.serve.deployment_graph import (
+    ClassNode,
+    FunctionNode,
+    _clear_dag_node_cache,
+)
 from ray.serve._private.deployment_graph_build import build as pipeline_build
 from ray.serve._private.deployment_graph_build import (
     get_and_validate_ingress_deployment,
@@ -112,6 +116,8 @@ def shutdown() -> None:
     Shuts down all processes and deletes all state associated with the
     instance.
     """
+    # Cached DAGs hold Serve handles, which are only valid for this instance.
+    _clear_dag_node_cache()
 
     try:
         client = get_global_client()
@@ -1,5 +1,9 @@
+import asyncio
+from collections import OrderedDict
 import json
 import os
+from typing import Any, Tuple
+
 import ray
 
 from ray.dag.class_node import ClassNode  # noqa: F401
@@ -16,6 +20,46 @@ FLAG_SERVE_DEPLOYMENT_HANDLE_IS_SYNC = (
 )
 
 
+_MAX_CACHED_DAG_NODES = 128
+# Executor DAGs deserialized in this process, in least recently used order, keyed by
+# their JSON. Each is stored with the Serve client and event loop its handles were
+# resolved under, since the handles are only valid for those.
+_dag_node_cache: "OrderedDict[str, Tuple[Any, asyncio.AbstractEventLoop, DAGNode]]" = (
+    OrderedDict()
+)
+
+
+def _deserialize_dag_node(dag_node_json: str) -> DAGNode:
+    """Deserialize the executor DAG, once per distinct JSON in this process.
+
+    Handles are unpickled anew every time they're sent to a replica, so this
+    keeps each copy from parsing the same DAG and resolving its handles again.
+    A DAG cached under another Serve client or event loop is replaced rather
+    than kept alongside, so stale clients and loops aren't held onto.
+    """
+    from ray.serve.context import get_global_client
+    from ray.serve._private.json_serde import dagnode_from_json
+
+    client = get_global_client()
+    loop = asyncio.get_running_loop()
+    cached = _dag_node_cache.get(dag_node_json)
+    if cached is not None and cached[0] is client and cached[1] is loop:
+        _dag_node_cache.move_to_end(dag_node_json)
+        return cached[2]
+
+    dag_node = json.loads(dag_node_json, object_hook=dagnode_from_json)
+    _dag_node_cache[dag_node_json] = (client, loop, dag_node)
+    _dag_node_cache.move_to_end(dag_node_json)
+    if len(_dag_node_cache) > _MAX_CACHED_DAG_NODES:
+        _dag_node_cache.popitem(last=False)
+    return dag_node
+
+
+def _clear_dag_node_cache():
+    """Drop all cached DAGs, e.g. when their Serve instance is shut down."""
+    _dag_node_cache.clear()
+
+
 @PublicAPI(stability="alpha")
 class RayServeDAGHandle:
     """Resolved from a DeploymentNode at runtime.
@@ -45,10 +89,11 @@ class RayServeDAGHandle:
     ) -> ray.ObjectRef:
         """Execute the request, returns a ObjectRef representing final result."""
         if self.dag_node is None:
-            from ray.serve._private.json_serde import dagnode_from_json
-
-            self.dag_node = json.loads(
-                self.dag_node_json, object_hook=dagnode_from_json
+            # Each handle executes its own copy of the cached DAG, since execute()
+            # keeps per-root state such as cache_from_last_execute. The copies
+            # share the resolved Serve handles.
+            self.dag_node = _deserialize_dag_node(self.dag_node_json).apply_recursive(
+                lambda node: node
             )
 
         if FLAG_SERVE_DEPLOYMENT_HANDLE_IS_SYNC:
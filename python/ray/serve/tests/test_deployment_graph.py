@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import os
 import sys
@@ -122,6 +123,47 @@ class NoargDriver:
         return await (await self.dag.remote())
 
 
+@serve.deployment
+class TwoDAGHandlesDriver:
+    def __init__(self, dag: RayServeDAGHandle):
+        # A second handle to the same DAG, as every handle unpickled from the
+        # same JSON is.
+        self.dags = [dag, RayServeDAGHandle(dag.dag_node_json)]
+
+    async def __call__(self, inputs):
+        refs = await asyncio.gather(
+            *[
+                dag.remote(inp, _ray_cache_refs=True)
+                for dag, inp in zip(self.dags, inputs)
+            ]
+        )
+        dag_nodes = [dag.dag_node for dag in self.dags]
+        return {
+            "results": await asyncio.gather(*refs),
+            "same_dag_node": dag_nodes[0] is dag_nodes[1],
+            "same_cached_refs": (
+                dag_nodes[0].cache_from_last_execute
+                is dag_nodes[1].cache_from_last_execute
+            ),
+        }
+
+
+def test_dag_handles_with_same_dag_run_concurrently(serve_instance):
+    """Handles to the same DAG share its deserialization, but not the state
+    of executing it.
+    """
+    with InputNode() as dag_input:
+        dag = Adder.bind(1).forward.bind(dag_input)
+    handle = serve.run(TwoDAGHandlesDriver.bind(dag))
+
+    for inputs in [(1, 2), (3, 4)]:
+        assert ray.get(handle.remote(inputs)) == {
+            "results": [inputs[0] + 1, inputs[1] + 1],
+            "same_dag_node": False,
+            "same_cached_refs": False,
+        }
+
+
 # TODO(Shreyas): Enable use_build once serve.build() PR is out.
 @pytest.mark.parametrize("use_build", [False])
 def test_single_func_no_input(serve_instance, use_build):
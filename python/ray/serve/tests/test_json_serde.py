@@ -30,6 +30,14 @@ from ray.serve._private.deployment_graph_build import (
     extract_deployments_from_serve_dag,
     transform_serve_dag_to_serve_executor_dag,
 )
+from ray.serve._private.deployment_executor_node import DeploymentExecutorNode
+from ray.serve._private.deployment_function_executor_node import (
+    DeploymentFunctionExecutorNode,
+)
+from ray.serve._private.deployment_method_executor_node import (
+    DeploymentMethodExecutorNode,
+)
+from ray.dag.constants import PARENT_CLASS_NODE_KEY
 
 RayHandleLike = TypeVar("RayHandleLike")
 pytestmark = pytest.mark.asyncio
@@ -120,6 +128,72 @@ async def test_simple_class_node_json_serde(serve_instance):
     )
 
 
+def _build_executor_nodes():
+    """Builds one of each executor node, with placeholder handles."""
+    deployment_node = DeploymentExecutorNode("deployment_handle", (1,), {"a": 2})
+    method_node = DeploymentMethodExecutorNode(
+        "forward",
+        (deployment_node,),
+        {},
+        other_args_to_resolve={PARENT_CLASS_NODE_KEY: deployment_node},
+    )
+    function_node = DeploymentFunctionExecutorNode(
+        "function_handle", (method_node,), {"b": 3}, other_args_to_resolve={}
+    )
+    return deployment_node, method_node, function_node
+
+
+async def test_executor_nodes_slots():
+    """Executor nodes are created per request, so they use __slots__ instead of
+    an instance __dict__.
+    """
+    for node in _build_executor_nodes():
+        # Not hasattr(), since DeploymentExecutorNode resolves any attribute.
+        with pytest.raises(AttributeError):
+            object.__getattribute__(node, "__dict__")
+
+
+async def test_executor_nodes_json_round_trip():
+    for node in _build_executor_nodes():
+        node._stable_uuid = f"uuid-{type(node).__name__}"
+        node_json = node.to_json()
+        deserialized = type(node).from_json(node_json)
+
+        assert type(deserialized) is type(node)
+        assert deserialized is not node
+        assert deserialized.get_stable_uuid() == node.get_stable_uuid()
+        assert deserialized.to_json() == node_json
+
+
+async def test_executor_nodes_copy():
+    for node in _build_executor_nodes():
+        copied = node._copy(
+            node.get_args(),
+            node.get_kwargs(),
+            node.get_options(),
+            node.get_other_args_to_resolve(),
+        )
+
+        assert type(copied) is type(node)
+        assert copied is not node
+        with pytest.raises(AttributeError):
+            object.__getattribute__(copied, "__dict__")
+        assert copied.get_stable_uuid() == node.get_stable_uuid()
+        assert copied.to_json() == node.to_json()
+
+
+async def test_executor_node_unset_slot_is_not_a_method():
+    deployment_node = DeploymentExecutorNode.__new__(DeploymentExecutorNode)
+    with pytest.raises(AttributeError):
+        deployment_node._deployment_handle
+    with pytest.raises(AttributeError):
+        deployment_node._bound_args
+
+    # Any other attribute is still a method of the deployment.
+    deployment_node = DeploymentExecutorNode("deployment_handle", (), {})
+    assert isinstance(deployment_node.forward, DeploymentMethodExecutorNode)
+
+
 async def _test_deployment_json_serde_helper(
     ray_dag: DAGNode, input=None, expected_num_deployments=None
 ):
@@ -2,37 +2,126 @@ import asyncio
 import time
 import numpy as np
 
+import ray
 
-async def measure_latency_ms(async_fn, args, expected_output, num_requests=10):
-    # warmup for 1sec
-    start = time.time()
-    while time.time() - start < 1:
-        await async_fn(args)
 
-    latency_stats = []
-    for _ in range(num_requests):
-        start = time.time()
-        await async_fn(args) == expected_output
-        end = time.time()
-        latency_stats.append((end - start) * 1000)
+async def _check_output(async_fn, args, expected_output):
+    """Check the output of one request, before any timed requests are issued."""
+    output = await async_fn(args)
+    # With an async handle, awaiting the call only yields the ObjectRef.
+    if isinstance(output, ray.ObjectRef):
+        output = await output
+    assert output == expected_output, f"Expected {expected_output}, got {output}."
 
-    return latency_stats
 
+async def _run_serially_for(async_fn, args, duration_secs, concurrency=1):
+    """Issue requests from `concurrency` loops, each waiting for its previous
+    request to complete, for duration_secs. Returns the completed count.
 
-async def measure_throughput_tps(async_fn, args, expected_output, duration_secs=10):
-    # warmup for 1sec
-    start = time.time()
-    while time.time() - start < 1:
-        await async_fn(args)
+    The loops stop on an event set by the event loop timer, so the clock is
+    not read once per request.
+    """
+    stop = asyncio.Event()
+    asyncio.get_running_loop().call_later(duration_secs, stop.set)
 
-    tps_stats = []
-    for _ in range(duration_secs):
-        start = time.time()
+    async def run_serially():
         request_completed = 0
-        while time.time() - start < 1:
-            await async_fn(args) == expected_output
+        while not stop.is_set():
+            await async_fn(args)
             request_completed += 1
-        tps_stats.append(request_completed)
+        return request_completed
+
+    return sum(await asyncio.gather(*[run_serially() for _ in range(concurrency)]))
+
+
+async def measure_latency_ms(
+    async_fn,
+    args,
+    expected_output,
+    num_requests=10,
+    target_relative_error=None,
+    max_requests=10_000,
+    warmup_secs=1,
+):
+    """Measure the latency of num_requests sequential requests, after
+    warmup_secs of requests whose latency is discarded.
+
+    If target_relative_error is set, num_requests is the minimum instead:
+    sampling continues until the standard error of the mean latency is
+    below that fraction of the mean, or max_requests samples are taken. At
+    least two samples are taken then, to estimate the standard error.
+    """
+    if target_relative_error is not None and target_relative_error <= 0:
+        raise ValueError(
+            f"target_relative_error must be positive, got {target_relative_error}."
+        )
+
+    await _check_output(async_fn, args, expected_output)
+
+    if target_relative_error is None:
+        max_requests = num_requests
+    else:
+        max_requests = max(num_requests, max_requests)
+
+    # Sample in integer ns with the monotonic clock into a preallocated
+    # buffer, convert to ms once. Requests started in the warmup are
+    # discarded.
+    latency_stats_ns = np.empty(max_requests, dtype=np.int64)
+    warmup_end_ns = time.perf_counter_ns() + int(warmup_secs * 1e9)
+    num_samples = 0
+    # Running mean and sum of squared deviations (Welford's algorithm).
+    mean_ns = 0.0
+    m2 = 0.0
+    while num_samples < max_requests:
+        start = time.perf_counter_ns()
+        await async_fn(args)
+        if start < warmup_end_ns:
+            continue
+        latency_ns = time.perf_counter_ns() - start
+        latency_stats_ns[num_samples] = latency_ns
+        num_samples += 1
+
+        if target_relative_error is not None:
+            delta = latency_ns - mean_ns
+            mean_ns += delta / num_samples
+            m2 += delta * (latency_ns - mean_ns)
+            # Standard error of the mean: sqrt(variance / n).
+            if (
+                num_samples >= max(2, num_requests)
+                and (m2 / (num_samples - 1) / num_samples) ** 0.5
+                < target_relative_error * mean_ns
+            ):
+                break
+
+    return latency_stats_ns[:num_samples] / 1e6
+
+
+async def measure_throughput_tps(
+    async_fn,
+    args,
+    expected_output,
+    duration_secs=10,
+    concurrency=32,
+    warmup_secs=1,
+    interval_secs=1,
+):
+    """Measure completed requests per second with `concurrency` requests
+    kept in flight: each of them issues the next request as soon as its
+    previous one completes.
+
+    After warmup_secs, returns the throughput of each interval_secs long
+    interval in duration_secs.
+    """
+    await _check_output(async_fn, args, expected_output)
+
+    await _run_serially_for(async_fn, args, warmup_secs, concurrency)
+
+    tps_stats = []
+    for _ in range(round(duration_secs / interval_secs)):
+        num_completed = await _run_serially_for(
+            async_fn, args, interval_secs, concurrency
+        )
+        tps_stats.append(num_completed / interval_secs)
 
     return tps_stats
 
@@ -42,8 +131,11 @@ async def benchmark_throughput_tps(
     expected,
     duration_secs=10,
     num_clients=1,
+    concurrency=32,
 ):
-    """Call deployment handle in a blocking for loop from multiple clients."""
+    """Call deployment handle in a blocking for loop from multiple clients,
+    each keeping `concurrency` requests in flight.
+    """
     client_tasks = [measure_throughput_tps for _ in range(num_clients)]
 
     throughput_stats_tps_list = await asyncio.gather(
@@ -53,6 +145,7 @@ async def benchmark_throughput_tps(
                 0,
                 expected,
                 duration_secs=duration_secs,
+                concurrency=concurrency,
             )
             for client_task in client_tasks
         ]
@@ -66,7 +159,13 @@ async def benchmark_throughput_tps(
     return mean, std
 
 
-async def benchmark_latency_ms(dag_handle, expected, num_requests=100, num_clients=1):
+async def benchmark_latency_ms(
+    dag_handle,
+    expected,
+    num_requests=100,
+    num_clients=1,
+    target_relative_error=None,
+):
     """Call deployment handle in a blocking for loop from multiple clients."""
     client_tasks = [measure_latency_ms for _ in range(num_clients)]
 
@@ -77,13 +176,12 @@ async def benchmark_latency_ms(dag_handle, expected, num_requests=100, num_clien
                 0,
                 expected,
                 num_requests=num_requests,
+                target_relative_error=target_relative_error,
             )
             for client_task in client_tasks
         ]
     )
-    latency_stats_ms = []
-    for client_rst in latency_stats_ms_list:
-        latency_stats_ms.extend(client_rst)
+    latency_stats_ms = np.concatenate(latency_stats_ms_list)
 
     mean = round(np.mean(latency_stats_ms), 2)
     std = round(np.std(latency_stats_ms), 2)
@@ -106,6 +106,68 @@ def parse_metric_to_base(metric_string: str) -> float:
     return values[1]
 
 
+# Rows of wrk stdout that parse_wrk_decoded_stdout() extracts metrics from,
+# matched in a single scan over the whole output. Each row is an outer group
+# holding one group per metric, named after its key in the metrics dict.
+_WRK_STDOUT_RE = re.compile(
+    r"^[ \t]*(?:"
+    # Statistics section
+    # Thread Stats   Avg      Stdev     Max   +/- Stdev
+    #   Latency    72.32ms    6.00ms 139.00ms   91.60%
+    #   Req/Sec   165.99     34.84   242.00     57.20%
+    r"(?P<latency>Latency[ \t]+(?P<per_thread_latency_avg_ms>\S+)[ \t]+\S+"
+    r"[ \t]+(?P<per_thread_latency_max_ms>\S+)[ \t]+\S+)"
+    r"|(?P<tps>Req/Sec[ \t]+(?P<per_thread_tps>\S+)[ \t]+\S+"
+    r"[ \t]+(?P<per_thread_max_tps>\S+)[ \t]+\S+)"
+    # Percentile section
+    # 50%   70.78ms
+    # 75%   72.59ms
+    # 90%   75.67ms
+    # 99%   98.71ms
+    r"|(?P<p50>50%[ \t]+(?P<P50_latency_ms>\S+))"
+    r"|(?P<p75>75%[ \t]+(?P<P75_latency_ms>\S+))"
+    r"|(?P<p90>90%[ \t]+(?P<P90_latency_ms>\S+))"
+    r"|(?P<p99>99%[ \t]+(?P<P99_latency_ms>\S+))"
+    # Total requests and transfer (might have timeout too)
+    # 13306 requests in 10.10s, 1.95MB read
+    r"|(?P<total>(?P<per_node_total_thoughput>\d+)[ \t]+requests[ \t]+\S+"
+    r"[ \t]+\S+[ \t]+(?P<per_node_total_transfer_KB>\S+)[ \t][^\n]*)"
+    # Socket errors: connect 0, read 0, write 0, timeout 100
+    r"|(?P<errors>Socket[ \t]+errors:[^\n]*[ \t]"
+    r"(?P<per_node_total_timeout_requests>\S+))"
+    # Summary section
+    # Requests/sec:   1317.73
+    # Transfer/sec:    198.19KB
+    r"|(?P<rps>Requests/sec:[ \t]+(?P<per_nodel_tps>\S+))"
+    r"|(?P<transfer>Transfer/sec:[ \t]+(?P<per_node_transfer_per_sec_KB>\S+))"
+    r")[ \t]*$",
+    re.MULTILINE,
+)
+
+# Row group name -> (metric key, parser) for each metric in that row.
+_WRK_ROW_METRICS = {
+    "latency": (
+        ("per_thread_latency_avg_ms", parse_time_to_ms),
+        ("per_thread_latency_max_ms", parse_time_to_ms),
+    ),
+    "tps": (
+        ("per_thread_tps", parse_metric_to_base),
+        ("per_thread_max_tps", parse_metric_to_base),
+    ),
+    "p50": (("P50_latency_ms", parse_time_to_ms),),
+    "p75": (("P75_latency_ms", parse_time_to_ms),),
+    "p90": (("P90_latency_ms", parse_time_to_ms),),
+    "p99": (("P99_latency_ms", parse_time_to_ms),),
+    "total": (
+        ("per_node_total_thoughput", int),
+        ("per_node_total_transfer_KB", parse_size_to_KB),
+    ),
+    "errors": (("per_node_total_timeout_requests", parse_metric_to_base),),
+    "rps": (("per_nodel_tps", parse_metric_to_base),),
+    "transfer": (("per_node_transfer_per_sec_KB", parse_size_to_KB),),
+}
+
+
 def parse_wrk_decoded_stdout(decoded_out):
     """
     Parse decoded wrk stdout to a dictionary.
@@ -136,51 +198,9 @@ def parse_wrk_decoded_stdout(decoded_out):
         'requests/sec': 1317.73, 'transfer/sec_KB': 198.19
     """
     metrics_dict = {}
-    for line in decoded_out.splitlines():
-        parsed = re.split(r"\s+", line.strip())
-        # Statistics section
-        # Thread Stats   Avg      Stdev     Max   +/- Stdev
-        #   Latency    72.32ms    6.00ms 139.00ms   91.60%
-        #   Req/Sec   165.99     34.84   242.00     57.20%
-        if parsed[0] == "Latency" and len(parsed) == 5:
-            metrics_dict["per_thread_latency_avg_ms"] = parse_time_to_ms(parsed[1])
-            metrics_dict["per_thread_latency_max_ms"] = parse_time_to_ms(parsed[3])
-        elif parsed[0] == "Req/Sec" and len(parsed) == 5:
-            metrics_dict["per_thread_tps"] = parse_metric_to_base(parsed[1])
-            metrics_dict["per_thread_max_tps"] = parse_metric_to_base(parsed[3])
-        # Latency Distribution header, ignored
-        elif parsed[0] == "Latency" and parsed[1] == "Distribution":
-            continue
-        # Percentile section
-        # 50%   70.78ms
-        # 75%   72.59ms
-        # 90%   75.67ms
-        # 99%   98.71ms
-        elif parsed[0] == "50%":
-            metrics_dict["P50_latency_ms"] = parse_time_to_ms(parsed[1])
-        elif parsed[0] == "75%":
-            metrics_dict["P75_latency_ms"] = parse_time_to_ms(parsed[1])
-        elif parsed[0] == "90%":
-            metrics_dict["P90_latency_ms"] = parse_time_to_ms(parsed[1])
-        elif parsed[0] == "99%":
-            metrics_dict["P99_latency_ms"] = parse_time_to_ms(parsed[1])
-        # Total requests and transfer (might have timeout too)
-        # 13306 requests in 10.10s, 1.95MB read
-        elif len(parsed) >= 6 and parsed[1] == "requests":
-            metrics_dict["per_node_total_thoughput"] = int(parsed[0])
-            metrics_dict["per_node_total_transfer_KB"] = parse_size_to_KB(parsed[4])
-        # Socket errors: connect 0, read 0, write 0, timeout 100
-        elif parsed[0] == "Socket" and parsed[1] == "errors:":
-            metrics_dict["per_node_total_timeout_requests"] = parse_metric_to_base(
-                parsed[-1]
-            )
-        # Summary section
-        # Requests/sec:   1317.73
-        # Transfer/sec:    198.19KB
-        elif parsed[0] == "Requests/sec:":
-            metrics_dict["per_nodel_tps"] = parse_metric_to_base(parsed[1])
-        elif parsed[0] == "Transfer/sec:":
-            metrics_dict["per_node_transfer_per_sec_KB"] = parse_size_to_KB(parsed[1])
+    for match in _WRK_STDOUT_RE.finditer(decoded_out):
+        for key, parse in _WRK_ROW_METRICS[match.lastgroup]:
+            metrics_dict[key] = parse(match[key])
 
     return metrics_dict
 
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from benchmark_utils import measure_latency_ms, measure_throughput_tps
+
+
+async def _noop(args):
+    return args
+
+
+async def _yield(args):
+    # Unlike _noop, give the event loop a chance to run its timers.
+    await asyncio.sleep(0)
+    return args
+
+
+def test_measure_latency_ms():
+    latency_stats_ms = asyncio.run(
+        measure_latency_ms(_noop, 0, 0, num_requests=5, warmup_secs=0)
+    )
+    assert len(latency_stats_ms) == 5
+    assert all(latency_ms >= 0 for latency_ms in latency_stats_ms)
+
+
+def test_measure_latency_ms_single_request_with_target_error():
+    """The standard error needs at least two samples, even if only one request
+    is asked for.
+    """
+    latency_stats_ms = asyncio.run(
+        measure_latency_ms(
+            _noop,
+            0,
+            0,
+            num_requests=1,
+            target_relative_error=0.5,
+            max_requests=100,
+            warmup_secs=0,
+        )
+    )
+    assert 2 <= len(latency_stats_ms) <= 100
+
+
+@pytest.mark.parametrize("target_relative_error", [0, -0.1])
+def test_measure_latency_ms_non_positive_target_error(target_relative_error):
+    with pytest.raises(ValueError, match="target_relative_error"):
+        asyncio.run(
+            measure_latency_ms(_noop, 0, 0, target_relative_error=target_relative_error)
+        )
+
+
+def test_measure_latency_ms_wrong_output():
+    with pytest.raises(AssertionError):
+        asyncio.run(measure_latency_ms(_noop, 0, 1, warmup_secs=0))
+
+
+def test_measure_throughput_tps():
+    tps_stats = asyncio.run(
+        measure_throughput_tps(
+            _yield,
+            0,
+            0,
+            duration_secs=0.03,
+            concurrency=4,
+            warmup_secs=0,
+            interval_secs=0.01,
+        )
+    )
+    assert len(tps_stats) == 3
+    assert all(tps > 0 for tps in tps_stats)
+
+
+def test_measure_throughput_tps_wrong_output():
+    with pytest.raises(AssertionError):
+        asyncio.run(measure_throughput_tps(_yield, 0, 1, warmup_secs=0))
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -0,0 +1,144 @@
+import re
+
+import pytest
+
+from serve_test_utils import (
+    parse_metric_to_base,
+    parse_size_to_KB,
+    parse_time_to_ms,
+    parse_wrk_decoded_stdout,
+)
+
+# The sample from the parse_wrk_decoded_stdout() docstring.
+DOCSTRING_STDOUT = """\
+Running 10s test @ http://127.0.0.1:8000/echo
+  8 threads and 96 connections
+  Thread Stats   Avg      Stdev     Max   +/- Stdev
+    Latency    72.32ms    6.00ms 139.00ms   91.60%
+    Req/Sec   165.99     34.84   242.00     57.20%
+  Latency Distribution
+     50%   70.78ms
+     75%   72.59ms
+     90%   75.67ms
+     99%   98.71ms
+  13306 requests in 10.10s, 1.95MB read
+Requests/sec:   1317.73
+Transfer/sec:    198.19KB
+"""
+
+# An overloaded run, where wrk reports timeouts and second-scale latencies.
+TIMEOUT_STDOUT = """\
+Running 30s test @ http://127.0.0.1:8000/echo
+  8 threads and 96 connections
+  Thread Stats   Avg      Stdev     Max   +/- Stdev
+    Latency   523.14ms  321.36ms   2.00s    68.13%
+    Req/Sec    24.01     15.62    90.00     64.29%
+  Latency Distribution
+     50%  466.24ms
+     75%  706.31ms
+     90%  965.45ms
+     99%    1.57s
+  5252 requests in 30.10s, 785.42KB read
+  Socket errors: connect 0, read 0, write 0, timeout 112
+Requests/sec:    174.49
+Transfer/sec:     26.09KB
+"""
+
+# A fast run with k-suffixed rates, read errors and non-2xx responses.
+SOCKET_ERRORS_STDOUT = """\
+Running 10s test @ http://127.0.0.1:8000/echo
+  2 threads and 10 connections
+  Thread Stats   Avg      Stdev     Max   +/- Stdev
+    Latency     4.12ms    1.03ms  25.31ms   88.12%
+    Req/Sec     1.23k   102.45     1.50k    71.00%
+  Latency Distribution
+     50%    3.98ms
+     75%    4.41ms
+     90%    5.02ms
+     99%    8.37ms
+  24512 requests in 10.01s, 3.58MB read
+  Socket errors: connect 0, read 12, write 0, timeout 0
+  Non-2xx or 3xx responses: 7
+Requests/sec:   2448.72
+Transfer/sec:    366.21KB
+"""
+
+
+def _parse_wrk_decoded_stdout_by_line(decoded_out):
+    """The line by line parser parse_wrk_decoded_stdout() replaced."""
+    metrics_dict = {}
+    for line in decoded_out.splitlines():
+        parsed = re.split(r"\s+", line.strip())
+        if parsed[0] == "Latency" and len(parsed) == 5:
+            metrics_dict["per_thread_latency_avg_ms"] = parse_time_to_ms(parsed[1])
+            metrics_dict["per_thread_latency_max_ms"] = parse_time_to_ms(parsed[3])
+        elif parsed[0] == "Req/Sec" and len(parsed) == 5:
+            metrics_dict["per_thread_tps"] = parse_metric_to_base(parsed[1])
+            metrics_dict["per_thread_max_tps"] = parse_metric_to_base(parsed[3])
+        elif parsed[0] == "Latency" and parsed[1] == "Distribution":
+            continue
+        elif parsed[0] == "50%":
+            metrics_dict["P50_latency_ms"] = parse_time_to_ms(parsed[1])
+        elif parsed[0] == "75%":
+            metrics_dict["P75_latency_ms"] = parse_time_to_ms(parsed[1])
+        elif parsed[0] == "90%":
+            metrics_dict["P90_latency_ms"] = parse_time_to_ms(parsed[1])
+        elif parsed[0] == "99%":
+            metrics_dict["P99_latency_ms"] = parse_time_to_ms(parsed[1])
+        elif len(parsed) >= 6 and parsed[1] == "requests":
+            metrics_dict["per_node_total_thoughput"] = int(parsed[0])
+            metrics_dict["per_node_total_transfer_KB"] = parse_size_to_KB(parsed[4])
+        elif parsed[0] == "Socket" and parsed[1] == "errors:":
+            metrics_dict["per_node_total_timeout_requests"] = parse_metric_to_base(
+                parsed[-1]
+            )
+        elif parsed[0] == "Requests/sec:":
+            metrics_dict["per_nodel_tps"] = parse_metric_to_base(parsed[1])
+        elif parsed[0] == "Transfer/sec:":
+            metrics_dict["per_node_transfer_per_sec_KB"] = parse_size_to_KB(parsed[1])
+
+    return metrics_dict
+
+
+@pytest.mark.parametrize(
+    "decoded_out", [DOCSTRING_STDOUT, TIMEOUT_STDOUT, SOCKET_ERRORS_STDOUT]
+)
+def test_parse_wrk_decoded_stdout_matches_line_parser(decoded_out):
+    assert parse_wrk_decoded_stdout(decoded_out) == _parse_wrk_decoded_stdout_by_line(
+        decoded_out
+    )
+
+
+def test_parse_wrk_decoded_stdout_docstring_sample():
+    assert parse_wrk_decoded_stdout(DOCSTRING_STDOUT) == {
+        "per_thread_latency_avg_ms": 72.32,
+        "per_thread_latency_max_ms": 139.0,
+        "per_thread_tps": 165.99,
+        "per_thread_max_tps": 242.0,
+        "P50_latency_ms": 70.78,
+        "P75_latency_ms": 72.59,
+        "P90_latency_ms": 75.67,
+        "P99_latency_ms": 98.71,
+        "per_node_total_thoughput": 13306,
+        "per_node_total_transfer_KB": 1.95 * 1024,
+        "per_nodel_tps": 1317.73,
+        "per_node_transfer_per_sec_KB": 198.19,
+    }
+
+
+@pytest.mark.parametrize(
+    "decoded_out,timeout_requests",
+    [(TIMEOUT_STDOUT, 112), (SOCKET_ERRORS_STDOUT, 0)],
+)
+def test_parse_wrk_decoded_stdout_socket_errors(decoded_out, timeout_requests):
+    metrics = parse_wrk_decoded_stdout(decoded_out)
+    assert metrics["per_node_total_timeout_requests"] == timeout_requests
+    assert "per_node_total_timeout_requests" not in parse_wrk_decoded_stdout(
+        DOCSTRING_STDOUT
+    )
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))